@@ -5,23 +5,63 @@ Contains the Cat class representing the enemy AI character.
 """
 
 import pygame
+import heapq
 import math
-from enum import Enum
-from typing import List, Tuple, TYPE_CHECKING
+from enum import IntEnum
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from level import Level
 
 
-class CatState(Enum):
+# 4-connected moves, in the priority order used by all cat pathing
+_DIRS_4 = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+class CatState(IntEnum):
     """Cat AI state enumeration."""
-    IDLE = "idle"
-    CHASE = "chase"
+    IDLE = 0
+    CHASE = 1
+
+
+# Plain int states for the per-frame checks; CatState(cat.state) gives the name
+IDLE = int(CatState.IDLE)
+CHASE = int(CatState.CHASE)
 
 
 class Cat:
     """Enemy AI - a cat that patrols and chases the mouse."""
     
+    __slots__ = (
+        'grid_x', 'grid_y', 'grid_size', 'level', 'level_number',
+        'state', 'move_timer', 'move_delay',
+        'chase_range', 'mouse_has_moved', 'last_known_mouse_pos',
+        'size',
+        'animation_timer', 'animation_speed',
+        '_walls', '_wall_stride', '_chase_range_sq', '_last_mouse_packed',
+        '_path', '_path_goal', '_sprite_frames', '_heart_orbit',
+    )
+    
+    # Colors shared by every cat
+    BODY_COLOR = (200, 162, 200)
+    BELLY_COLOR = (255, 253, 208)
+    INNER_EAR_COLOR = (255, 192, 203)
+    BLUSH_COLOR = (255, 192, 203)
+    PUPIL_COLOR = (100, 149, 237)  # Cornflower blue
+    NOSE_COLOR = (255, 105, 180)
+    HEART_COLOR = (255, 182, 193)
+    
+    # Tiny chase heart shape, relative to the heart's center
+    _HEART_LOBES = ((-1, -1), (1, -1))
+    _HEART_POINTS = ((0, 2), (-2, 0), (2, 0))
+    
+    # First open move in _DIRS_4 order for every combination of open
+    # neighbors, indexed by a mask with bit 3 = down ... bit 0 = left
+    _FALLBACK_MOVES = tuple(
+        next((move for bit, move in zip((8, 4, 2, 1), _DIRS_4) if mask & bit), (0, 0))
+        for mask in range(16)
+    )
+    
     def __init__(self, grid_x: int, grid_y: int, grid_size: int, level: 'Level', level_number: int = 1):
         """
         Initialize the cat.
@@ -38,9 +78,11 @@ class Cat:
         self.grid_size = grid_size
         self.level = level
         self.level_number = level_number
+        self._walls = level.wall_mask
+        self._wall_stride = level.wall_stride
         
         #AI State 
-        self.state = CatState.IDLE
+        self.state = IDLE
         self.move_timer = 0
         # Speed scaling: cat gets faster each level (lower delay = faster movement)
         base_delay = 40  # Increased from 25 to make first level easier
@@ -49,18 +91,47 @@ class Cat:
         
         # Chase behavior 
         self.chase_range = 20  
+        self._chase_range_sq = self.chase_range * self.chase_range
         self.mouse_has_moved = False  
         self.last_known_mouse_pos = (grid_x, grid_y)
+        # Same position packed into one int for the cheap per-frame idle check
+        self._last_mouse_packed = (grid_x << 16) | grid_y
+        
+        # Cached path to the mouse, reused until the mouse changes cell
+        self._path: List[Tuple[int, int]] = []
+        self._path_goal: Optional[Tuple[int, int]] = None
         
         # Visual properties
-        self.body_color = (200, 162, 200)  
-        self.belly_color = (255, 253, 208)  
         self.size = grid_size - 2
         
         # Animation
         self.animation_timer = 0
         self.animation_speed = 8
         
+        # Pre-rendered body, one frame per tail sway direction. Extra width
+        # leaves room for the tail poking out to the right.
+        self._sprite_frames = [pygame.Surface((self.size + 20, self.size + 2), pygame.SRCALPHA)
+                               for _ in range(2)]
+        self._bake_sprite(0, 6)
+        self._bake_sprite(1, -6)
+        
+        # Match the display format so blits skip per-pixel conversion
+        if pygame.display.get_surface() is not None:
+            self._sprite_frames = [frame.convert_alpha() for frame in self._sprite_frames]
+        
+        # Chase heart geometry relative to the cat center, per animation frame
+        # and heart, as (lobe centers, triangle points)
+        self._heart_orbit = []
+        for t in range(self.animation_speed * 2):
+            hearts = []
+            for i in range(4):
+                orbit_x = int(25 * math.cos((t + i * 90) * 0.1))
+                orbit_y = int(25 * math.sin((t + i * 90) * 0.1))
+                lobes = tuple((orbit_x + ox, orbit_y + oy) for ox, oy in self._HEART_LOBES)
+                points = tuple((orbit_x + ox, orbit_y + oy) for ox, oy in self._HEART_POINTS)
+                hearts.append((lobes, points))
+            self._heart_orbit.append(hearts)
+        
     def should_start_chasing(self, mouse_x: int, mouse_y: int) -> bool:
         """
         Determine if cat should start chasing based on mouse movement.
@@ -73,9 +144,10 @@ class Cat:
             True if cat should chase, False otherwise
         """
         # Check if mouse has moved from initial position
-        if (mouse_x, mouse_y) != self.last_known_mouse_pos:
+        packed = (mouse_x << 16) | mouse_y
+        if packed != self._last_mouse_packed:
             self.mouse_has_moved = True
-            self.last_known_mouse_pos = (mouse_x, mouse_y)
+            self._last_mouse_packed = packed
         
         # Cat starts chasing as soon as mouse moves
         return self.mouse_has_moved
@@ -90,20 +162,11 @@ class Cat:
         """Get pixel Y position from grid position."""
         return self.grid_y * self.grid_size
     
-    def distance_to(self, target_x: int, target_y: int) -> float:
-        """
-        Calculate distance to target position.
-        
-        Args:
-            target_x: Target grid X position
-            target_y: Target grid Y position
-            
-        Returns:
-            Distance in grid units
-        """
-        dx = self.grid_x - target_x
-        dy = self.grid_y - target_y
-        return math.sqrt(dx * dx + dy * dy)
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Get pixel position of the center of the current cell."""
+        half = self.grid_size // 2
+        return (self.grid_x * self.grid_size + half, self.grid_y * self.grid_size + half)
     
     def can_see_mouse(self, mouse_x: int, mouse_y: int) -> bool:
         """
@@ -116,9 +179,14 @@ class Cat:
         Returns:
             True if mouse is visible, False otherwise
         """
-        # Distance-based detection
-        distance = self.distance_to(mouse_x, mouse_y)
-        return distance <= self.chase_range
+        # Cheap box rejection before any multiplies
+        dx = self.grid_x - mouse_x
+        dy = self.grid_y - mouse_y
+        if abs(dx) > self.chase_range or abs(dy) > self.chase_range:
+            return False
+        
+        # Distance-based detection (squared, so no sqrt per frame)
+        return dx * dx + dy * dy <= self._chase_range_sq
     
     def get_next_move_towards(self, target_x: int, target_y: int) -> Tuple[int, int]:
         """
@@ -152,12 +220,146 @@ class Cat:
         elif self.can_move_to(self.grid_x, self.grid_y + dy):
             return (0, dy)
         else:
-            # If stuck, try all possible moves to find an escape route
-            possible_moves = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-            for move_dx, move_dy in possible_moves:
-                if self.can_move_to(self.grid_x + move_dx, self.grid_y + move_dy):
-                    return (move_dx, move_dy)
-            return (0, 0)
+            # If stuck, look up an escape route from the open neighbors
+            x, y = self.grid_x, self.grid_y
+            mask = ((self.can_move_to(x, y + 1) << 3) | (self.can_move_to(x, y - 1) << 2) |
+                    (self.can_move_to(x + 1, y) << 1) | self.can_move_to(x - 1, y))
+            return self._FALLBACK_MOVES[mask]
+    
+    def _astar(self, goal: Tuple[int, int], max_iterations: int = 200) -> List[Tuple[int, int]]:
+        """
+        Find the shortest path to goal using A* with jump point search.
+        
+        Only jump points are pushed onto the open set; the straight runs
+        between them are filled back in when the path is rebuilt.
+        
+        Args:
+            goal: Target (x, y) grid position
+            max_iterations: Maximum nodes to expand before giving up
+            
+        Returns:
+            Cells to walk through, ordered last-to-first so the next step
+            can be popped off the end. Empty if no path was found.
+        """
+        start = (self.grid_x, self.grid_y)
+        if start == goal:
+            return []
+        
+        # Bind hot lookups to locals once rather than per expanded node
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        jump = self._jump
+        successor_directions = self._successor_directions
+        goal_x, goal_y = goal
+        
+        # Manhattan distance is admissible on a 4-connected grid
+        open_set = [(abs(start[0] - goal_x) + abs(start[1] - goal_y), 0, start)]
+        came_from = {}
+        g_score = {start: 0}
+        
+        iterations = 0
+        while open_set and iterations < max_iterations:
+            iterations += 1
+            _, current_g, current = heappop(open_set)
+            
+            if current == goal:
+                # Walk back from the goal, filling in the cells between jump points
+                path = []
+                while current != start:
+                    parent = came_from[current]
+                    step_x = (parent[0] > current[0]) - (parent[0] < current[0])
+                    step_y = (parent[1] > current[1]) - (parent[1] < current[1])
+                    x, y = current
+                    while (x, y) != parent:
+                        path.append((x, y))
+                        x += step_x
+                        y += step_y
+                    current = parent
+                return path
+            
+            # Skip stale heap entries
+            if current_g > g_score[current]:
+                continue
+            
+            current_x, current_y = current
+            for move_dx, move_dy in successor_directions(current, came_from.get(current)):
+                jump_point = jump(current_x, current_y, move_dx, move_dy, goal)
+                if jump_point is None:
+                    continue
+                
+                jump_x, jump_y = jump_point
+                tentative_g = current_g + abs(jump_x - current_x) + abs(jump_y - current_y)
+                if tentative_g < g_score.get(jump_point, tentative_g + 1):
+                    came_from[jump_point] = current
+                    g_score[jump_point] = tentative_g
+                    heappush(open_set, (tentative_g + abs(jump_x - goal_x) + abs(jump_y - goal_y),
+                                        tentative_g, jump_point))
+        
+        return []
+    
+    def _successor_directions(self, node: Tuple[int, int],
+                              parent: Optional[Tuple[int, int]]) -> Sequence[Tuple[int, int]]:
+        """
+        Get the pruned set of directions to search from a jump point.
+        
+        Paths are kept canonical by turning freely off horizontal runs, while
+        vertical runs only turn where a wall forces them to.
+        
+        Args:
+            node: Jump point being expanded
+            parent: Jump point it was reached from, or None for the start
+            
+        Returns:
+            (dx, dy) directions worth jumping in
+        """
+        if parent is None:
+            return _DIRS_4
+        
+        x, y = node
+        dx = (x > parent[0]) - (x < parent[0])
+        dy = (y > parent[1]) - (y < parent[1])
+        if dx:
+            return [(dx, 0), (0, 1), (0, -1)]
+        
+        can_move_to = self.can_move_to
+        directions = [(0, dy)]
+        for side in (1, -1):
+            if not can_move_to(x + side, y - dy) and can_move_to(x + side, y):
+                directions.append((side, 0))
+        return directions
+    
+    def _jump(self, x: int, y: int, dx: int, dy: int, goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Walk in a straight line until reaching the next jump point.
+        
+        Args:
+            x: Grid X position to start from
+            y: Grid Y position to start from
+            dx: Step in X direction
+            dy: Step in Y direction
+            goal: Target (x, y) grid position
+            
+        Returns:
+            The jump point found, or None if a wall was hit first
+        """
+        can_move_to = self.can_move_to
+        goal_x, goal_y = goal
+        while True:
+            x += dx
+            y += dy
+            if not can_move_to(x, y):
+                return None
+            if x == goal_x and y == goal_y:
+                return (x, y)
+            
+            if dx:
+                # Stop where turning vertical leads somewhere interesting
+                if self._jump(x, y, 0, 1, goal) or self._jump(x, y, 0, -1, goal):
+                    return (x, y)
+            elif ((not can_move_to(x + 1, y - dy) and can_move_to(x + 1, y)) or
+                  (not can_move_to(x - 1, y - dy) and can_move_to(x - 1, y))):
+                # Forced neighbor: we just passed a wall corner
+                return (x, y)
     
     def can_move_to(self, grid_x: int, grid_y: int) -> bool:
         """
@@ -170,13 +372,11 @@ class Cat:
         Returns:
             True if position is valid, False otherwise
         """
-        # Check bounds
-        if (grid_x < 0 or grid_x >= self.level.width or 
-            grid_y < 0 or grid_y >= self.level.height):
+        # The wall mask's blocked border covers the bounds check
+        if self._walls[(grid_y + 1) * self._wall_stride + grid_x + 1]:
             return False
         
-        # Check for walls
-        return not self.level.is_wall(grid_x, grid_y)
+        return not self.level.has_rolling_obstacle(grid_x, grid_y)
     
     def update_idle(self):
         """Update idle behavior - cat just waits."""
@@ -195,10 +395,22 @@ class Cat:
         if self.can_see_mouse(mouse_x, mouse_y):
             self.last_known_mouse_pos = (mouse_x, mouse_y)
         
-        # simplified pathfinding
         target_x, target_y = mouse_x, mouse_y
+        goal = (target_x, target_y)
+        
+        # Only run A* again when the mouse has moved or the path ran out
+        if self._path_goal != goal or not self._path:
+            self._path = self._astar(goal)
+            self._path_goal = goal
+        elif not self.can_move_to(*self._path[-1]):
+            # Something rolled into the way, plan around it
+            self._path = self._astar(goal)
+        
+        if self._path:
+            self.grid_x, self.grid_y = self._path.pop()
+            return
         
-        # Move towards mouse
+        # No path found, fall back to greedy steps
         dx, dy = self.get_next_move_towards(target_x, target_y)
         if dx != 0 or dy != 0:
             # Double-check that the move is actually valid before executing
@@ -228,36 +440,39 @@ class Cat:
         
         self.move_timer = 0
         
+        # Nothing to decide while idle and the mouse hasn't moved
+        if self.state == IDLE and ((mouse_x << 16) | mouse_y) == self._last_mouse_packed:
+            return
+        
         # State machine logic
-        if self.state == CatState.IDLE:
+        if self.state == IDLE:
             # Check if mouse has moved - if so, start chasing
             if self.should_start_chasing(mouse_x, mouse_y):
-                self.state = CatState.CHASE
+                self.state = CHASE
         
-        elif self.state == CatState.CHASE:
+        elif self.state == CHASE:
             # Always chase the mouse
             self.update_chase(mouse_x, mouse_y)
     
-    def draw(self, screen: pygame.Surface):
+    def _bake_sprite(self, frame_idx: int, tail_sway: int):
         """
-        Draw the cat on the screen.
+        Render the static cat body for one tail frame into the sprite cache.
         
         Args:
-            screen: Pygame surface to draw on
+            frame_idx: Index into the sprite frame list
+            tail_sway: Vertical tail offset for this frame
         """
-        # Calculate position with small offset for centering
-        x = self.pixel_x + 1
-        y = self.pixel_y + 1
-        center_x = x + self.size // 2
-        center_y = y + self.size // 2
+        surface = self._sprite_frames[frame_idx]
+        center_x = self.size // 2
+        center_y = self.size // 2
         
         # Cat body
         body_radius = self.size // 2
-        pygame.draw.circle(screen, self.body_color, (center_x, center_y), body_radius)
+        pygame.draw.circle(surface, self.BODY_COLOR, (center_x, center_y), body_radius)
         
         # Belly
         belly_radius = body_radius - 5
-        pygame.draw.circle(screen, self.belly_color, (center_x, center_y + 3), belly_radius)
+        pygame.draw.circle(surface, self.BELLY_COLOR, (center_x, center_y + 3), belly_radius)
         
         # Cat ears
         ear_size = self.size // 4
@@ -269,7 +484,7 @@ class Cat:
             (center_x - ear_offset - ear_size//2, center_y - ear_size - ear_size//2),
             (center_x - ear_offset + ear_size//2, center_y - ear_size - ear_size//2)
         ]
-        pygame.draw.polygon(screen, self.body_color, left_ear_points)
+        pygame.draw.polygon(surface, self.BODY_COLOR, left_ear_points)
         
         # Left ear inner
         inner_ear_points = [
@@ -277,7 +492,7 @@ class Cat:
             (center_x - ear_offset - ear_size//3, center_y - ear_size - ear_size//3),
             (center_x - ear_offset + ear_size//3, center_y - ear_size - ear_size//3)
         ]
-        pygame.draw.polygon(screen, (255, 192, 203), inner_ear_points)
+        pygame.draw.polygon(surface, self.INNER_EAR_COLOR, inner_ear_points)
         
         # Right ear
         right_ear_points = [
@@ -285,7 +500,7 @@ class Cat:
             (center_x + ear_offset - ear_size//2, center_y - ear_size - ear_size//2),
             (center_x + ear_offset + ear_size//2, center_y - ear_size - ear_size//2)
         ]
-        pygame.draw.polygon(screen, self.body_color, right_ear_points)
+        pygame.draw.polygon(surface, self.BODY_COLOR, right_ear_points)
         
         # Right ear inner
         inner_ear_points = [
@@ -293,7 +508,7 @@ class Cat:
             (center_x + ear_offset - ear_size//3, center_y - ear_size - ear_size//3),
             (center_x + ear_offset + ear_size//3, center_y - ear_size - ear_size//3)
         ]
-        pygame.draw.polygon(screen, (255, 192, 203), inner_ear_points)
+        pygame.draw.polygon(surface, self.INNER_EAR_COLOR, inner_ear_points)
         
         # Eyes
         eye_radius = 5
@@ -301,23 +516,23 @@ class Cat:
         eye_y_offset = -4
         
         # Left eye 
-        pygame.draw.circle(screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                          (center_x - eye_offset, center_y + eye_y_offset), eye_radius)
         # Left eye pupil 
-        pygame.draw.circle(screen, (100, 149, 237),  # Cornflower blue
+        pygame.draw.circle(surface, self.PUPIL_COLOR,
                          (center_x - eye_offset + 1, center_y + eye_y_offset), 3)
         # Left eye sparkle
-        pygame.draw.circle(screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                          (center_x - eye_offset + 2, center_y + eye_y_offset - 1), 1)
         
         # Right eye 
-        pygame.draw.circle(screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                          (center_x + eye_offset, center_y + eye_y_offset), eye_radius)
         # Right eye pupil 
-        pygame.draw.circle(screen, (100, 149, 237),  # Cornflower blue
+        pygame.draw.circle(surface, self.PUPIL_COLOR,
                          (center_x + eye_offset + 1, center_y + eye_y_offset), 3)
         # Right eye sparkle
-        pygame.draw.circle(screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                          (center_x + eye_offset + 2, center_y + eye_y_offset - 1), 1)
         
         # Nose
@@ -327,43 +542,62 @@ class Cat:
             (center_x - 2, nose_y + 3),
             (center_x + 2, nose_y + 3)
         ]
-        pygame.draw.polygon(screen, (255, 105, 180), nose_points)
+        pygame.draw.polygon(surface, self.NOSE_COLOR, nose_points)
         
         # Mouth
         mouth_y = center_y + 6
-        pygame.draw.arc(screen, (255, 105, 180), 
+        pygame.draw.arc(surface, self.NOSE_COLOR, 
                        (center_x - 4, mouth_y - 2, 8, 4), 0, 3.14159, 2)
         
         # Tail
-        tail_sway = 6 if self.animation_timer < self.animation_speed else -6
         tail_start = (center_x + body_radius - 3, center_y)
         tail_mid = (center_x + body_radius + 8, center_y + tail_sway)
         tail_end = (center_x + body_radius + 15, center_y - tail_sway)
         
         # Tail
-        pygame.draw.lines(screen, self.body_color, False, 
+        pygame.draw.lines(surface, self.BODY_COLOR, False, 
                          [tail_start, tail_mid, tail_end], 4)
         
         # Blush Marks
-        pygame.draw.circle(screen, (255, 192, 203),
+        pygame.draw.circle(surface, self.BLUSH_COLOR,
                          (center_x - self.size // 3, center_y + 8), 3)
-        pygame.draw.circle(screen, (255, 192, 203),
+        pygame.draw.circle(surface, self.BLUSH_COLOR,
                          (center_x + self.size // 3, center_y + 8), 3)
+    
+    def draw(self, screen: pygame.Surface):
+        """
+        Draw the cat on the screen.
+        
+        Args:
+            screen: Pygame surface to draw on
+        """
+        # Skip cats that are fully outside the visible area. The reach covers
+        # the tail on the right and the chase hearts on every side.
+        viewport = screen.get_clip()
+        reach = self.size + 24
+        if (self.pixel_x + reach < viewport.left or self.pixel_x - reach >= viewport.right or
+                self.pixel_y + reach < viewport.top or self.pixel_y - reach >= viewport.bottom):
+            return
+        
+        # Calculate position with small offset for centering
+        x = self.pixel_x + 1
+        y = self.pixel_y + 1
+        center_x = x + self.size // 2
+        center_y = y + self.size // 2
+        
+        # Pre-rendered body for the current tail frame
+        frame = 0 if self.animation_timer < self.animation_speed else 1
+        screen.blit(self._sprite_frames[frame], (x, y))
         
         # State indicator
-        if self.state == CatState.CHASE:
+        if self.state == CHASE:
             # Pink hearts
-            import math
-            for i in range(4):
-                angle = (self.animation_timer + i * 90) * 0.1
-                heart_x = center_x + int(25 * math.cos(angle))
-                heart_y = center_y + int(25 * math.sin(angle))
-                
+            for lobes, points in self._heart_orbit[self.animation_timer]:
                 # Tiny heart
-                pygame.draw.circle(screen, (255, 182, 193), (heart_x - 1, heart_y - 1), 2)
-                pygame.draw.circle(screen, (255, 182, 193), (heart_x + 1, heart_y - 1), 2)
-                pygame.draw.polygon(screen, (255, 182, 193), 
-                                  [(heart_x, heart_y + 2), (heart_x - 2, heart_y), (heart_x + 2, heart_y)])
+                for offset_x, offset_y in lobes:
+                    pygame.draw.circle(screen, self.HEART_COLOR, (center_x + offset_x, center_y + offset_y), 2)
+                pygame.draw.polygon(screen, self.HEART_COLOR,
+                                  [(center_x + offset_x, center_y + offset_y) for offset_x, offset_y in points])
     
     def get_rect(self) -> pygame.Rect:
         """
@@ -5,12 +5,13 @@ Contains the Level class managing game world layout, obstacles, and collectibles
 """
 
 import pygame
+import math
 import random
-from typing import List, Tuple, Set
-from enum import Enum
+from typing import Dict, List, Optional, Tuple, Set
+from enum import IntEnum
 
 
-class CellType(Enum):
+class CellType(IntEnum):
     """Grid cell type enumeration."""
     EMPTY = 0
     WALL = 1
@@ -19,10 +20,30 @@ class CellType(Enum):
     OBSTACLE = 4
 
 
+# Plain int cell values for the per-frame checks against grid bytes
+EMPTY = int(CellType.EMPTY)
+WALL = int(CellType.WALL)
+CHEESE = int(CellType.CHEESE)
+GOAL = int(CellType.GOAL)
+OBSTACLE = int(CellType.OBSTACLE)
+
+# Directions a rolling obstacle can start moving in
+ROLL_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+# Some cell art spills past the cell edge, so cell sprites carry a margin
+CELL_SPRITE_PADDING = 4
+
+# Byte translation table mapping each CellType value to 1 if it blocks movement
+_BLOCKING_TABLE = bytes(
+    1 if value in (WALL, OBSTACLE) else 0 for value in range(256)
+)
+
+
 class Level:
     """Game level containing layout, obstacles, and collectibles."""
     
-    def __init__(self, width: int, height: int, level_number: int = 1):
+    def __init__(self, width: int, height: int, level_number: int = 1,
+                 seed: Optional[int] = None):
         """
         Initialize the level.
         
@@ -30,22 +51,32 @@ class Level:
             width: Level width in grid cells
             height: Level height in grid cells
             level_number: Current level number for difficulty scaling
+            seed: Optional seed for a reproducible layout
         """
         self.width = width
         self.height = height
         self.level_number = level_number
         self.grid_size = 40  # Pixel size of each grid cell
         
-        # Game world grid
-        self.grid = [[CellType.EMPTY for _ in range(width)] for _ in range(height)]
+        # Game world grid, one byte per cell holding a CellType value
+        self.grid: List[bytearray] = [bytearray(width) for _ in range(height)]
         
         # Collectibles and objectives
         self.cheese_positions: Set[Tuple[int, int]] = set()
         self.goal_positions: Set[Tuple[int, int]] = set()
         self.obstacle_positions: Set[Tuple[int, int]] = set()
+        self._cheese_remaining = 0
+        self._goal_xy: Tuple[int, int] = (-1, -1)
         
         # Rolling obstacles (tomatoes)
         self.rolling_obstacles: List[RollingObstacle] = []
+        # Cells under rolling obstacles, packed as (x << 16) | y like Cat's keys
+        self._rolling_cells: Set[int] = set()
+        
+        # Static blocking cells with a 1-cell blocked border, so a bounds
+        # check and a wall check fold into a single lookup
+        self.wall_stride = width + 2
+        self.wall_mask = bytearray(self.wall_stride * (height + 2))
         
         # Color palette
         self.colors = {
@@ -56,24 +87,32 @@ class Level:
             CellType.OBSTACLE: (173, 216, 230),  # Blue obstacles
         }
         
+        # Colors indexed directly by the CellType value stored in the grid
+        self._palette = tuple(self.colors[cell_type] for cell_type in CellType)
+        
+        # Pre-rendered art for decorated cells
+        self._cell_sprites = {
+            cell_type: self._bake_cell_sprite(cell_type)
+            for cell_type in (CellType.CHEESE, CellType.GOAL, CellType.OBSTACLE)
+        }
+        
+        # Level-owned random source for layout generation
+        self._rng = random.Random(seed)
+        
         # Generate level layout
         self.generate_level()
     
     def generate_level(self):
         """Generate the level layout based on level number."""
-        # Clear the grid
-        for y in range(self.height):
-            for x in range(self.width):
-                self.grid[y][x] = CellType.EMPTY
+        # Clear the grid and add perimeter walls in one pass over the rows
+        wall = bytes([CellType.WALL])
+        inner_row = wall + bytes(self.width - 2) + wall
+        for row in self.grid:
+            row[:] = inner_row
         
-        # Add perimeter walls
-        for x in range(self.width):
-            self.grid[0][x] = CellType.WALL
-            self.grid[self.height - 1][x] = CellType.WALL
-        
-        for y in range(self.height):
-            self.grid[y][0] = CellType.WALL
-            self.grid[y][self.width - 1] = CellType.WALL
+        wall_row = wall * self.width
+        self.grid[0][:] = wall_row
+        self.grid[-1][:] = wall_row
         
         # Add some interior walls/obstacles
         self.add_interior_walls()
@@ -89,25 +128,34 @@ class Level:
         
         # Add static obstacles based on level
         self.add_static_obstacles()
+        
+        # Snapshot blocking cells for fast movement checks
+        self.build_wall_mask()
+        
+        # Rasterize the static cell layer once
+        self.render_background()
+    
+    def build_wall_mask(self):
+        """Rebuild the padded wall mask from the current grid."""
+        stride = self.wall_stride
+        mask = self.wall_mask
+        mask[:] = b'\x01' * len(mask)
+        
+        for y, row in enumerate(self.grid):
+            row_start = (y + 1) * stride + 1
+            mask[row_start:row_start + self.width] = row.translate(_BLOCKING_TABLE)
     
     def add_interior_walls(self):
         """Add interior walls to create interesting layouts."""
         # Add some scattered walls for cover
         wall_count = min(8 + self.level_number, 20)
         
-        for _ in range(wall_count):
-            # Try to place a wall in a random location
-            for _ in range(50):  # Max attempts
-                x = random.randint(2, self.width - 3)
-                y = random.randint(2, self.height - 3)
-                
-                # Don't place walls near starting positions
-                if (x < 4 and y < 4) or (x > self.width - 5 and y > self.height - 5):
-                    continue
-                
-                if self.grid[y][x] == CellType.EMPTY:
-                    self.grid[y][x] = CellType.WALL
-                    break
+        # Don't place walls near starting positions
+        candidates = [(x, y) for x, y in self.empty_cells(2, 2, self.width - 3, self.height - 3)
+                      if not ((x < 4 and y < 4) or (x > self.width - 5 and y > self.height - 5))]
+        
+        for x, y in self._rng.sample(candidates, min(wall_count, len(candidates))):
+            self.grid[y][x] = CellType.WALL
         
         # Add some kitchen furniture (rectangular blocks)
         self.add_kitchen_furniture()
@@ -115,50 +163,40 @@ class Level:
     def add_kitchen_furniture(self):
         """Add kitchen furniture as rectangular obstacles."""
         furniture_pieces = min(2 + self.level_number // 2, 4)
+        randint = self._rng.randint
         
         for _ in range(furniture_pieces):
             # Try to place furniture
             for _ in range(30):  # Max attempts
-                width = random.randint(2, 4)
-                height = random.randint(2, 3)
-                x = random.randint(3, self.width - width - 3)
-                y = random.randint(3, self.height - height - 3)
+                width = randint(2, 4)
+                height = randint(2, 3)
+                x = randint(3, self.width - width - 3)
+                y = randint(3, self.height - height - 3)
                 
                 # Check if area is clear
-                clear = True
-                for fy in range(height):
-                    for fx in range(width):
-                        if self.grid[y + fy][x + fx] != CellType.EMPTY:
-                            clear = False
-                            break
-                    if not clear:
-                        break
+                if not self.is_area_empty(x, y, width, height):
+                    continue
                 
-                if clear:
-                    # Place furniture
-                    for fy in range(height):
-                        for fx in range(width):
-                            self.grid[y + fy][x + fx] = CellType.WALL
-                    break
+                # Place furniture
+                wall_run = bytes([CellType.WALL]) * width
+                for row in self.grid[y:y + height]:
+                    row[x:x + width] = wall_run
+                break
     
     def add_cheese(self):
         """Add cheese collectibles to the level."""
         cheese_count = 3 + self.level_number
         self.cheese_positions.clear()
         
-        for _ in range(cheese_count):
-            # Try to place cheese in random empty location
-            for _ in range(100):  
-                x = random.randint(1, self.width - 2)
-                y = random.randint(1, self.height - 2)
-                
-                if (self.grid[y][x] == CellType.EMPTY and 
-                    (x, y) not in self.cheese_positions and
-                    not (x < 3 and y < 3)):  
-                    
-                    self.cheese_positions.add((x, y))
-                    self.grid[y][x] = CellType.CHEESE
-                    break
+        # Pick distinct empty cells away from the starting corner
+        candidates = [(x, y) for x, y in self.empty_cells(1, 1, self.width - 2, self.height - 2)
+                      if not (x < 3 and y < 3)]
+        
+        for x, y in self._rng.sample(candidates, min(cheese_count, len(candidates))):
+            self.cheese_positions.add((x, y))
+            self.grid[y][x] = CellType.CHEESE
+        
+        self._cheese_remaining = len(self.cheese_positions)
     
     def add_goal(self):
         """Add the goal (mouse hole) to the level."""
@@ -173,6 +211,7 @@ class Level:
             self.grid[goal_y][goal_x] = CellType.EMPTY
         
         self.goal_positions.add((goal_x, goal_y))
+        self._goal_xy = (goal_x, goal_y)
         self.grid[goal_y][goal_x] = CellType.GOAL
     
     def add_rolling_obstacles(self):
@@ -182,21 +221,21 @@ class Level:
         # Add rolling obstacles based on level difficulty
         obstacle_count = min(self.level_number // 2, 3)
         
-        for _ in range(obstacle_count):
-            # Try to place rolling obstacle
-            for _ in range(50):  
-                x = random.randint(3, self.width - 4)
-                y = random.randint(3, self.height - 4)
-                
-                if (self.grid[y][x] == CellType.EMPTY and
-                    (x, y) not in self.cheese_positions and
-                    (x, y) not in self.goal_positions):
-                    
-                    # Create rolling obstacle
-                    direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
-                    obstacle = RollingObstacle(x, y, direction, self.grid_size)
-                    self.rolling_obstacles.append(obstacle)
-                    break
+        # EMPTY cells never hold cheese or the goal
+        candidates = self.empty_cells(3, 3, self.width - 4, self.height - 4)
+        
+        for x, y in self._rng.sample(candidates, min(obstacle_count, len(candidates))):
+            # Create rolling obstacle
+            direction = self._rng.choice(ROLL_DIRECTIONS)
+            obstacle = RollingObstacle(x, y, direction, self.grid_size)
+            self.rolling_obstacles.append(obstacle)
+        
+        self._sync_rolling_cells()
+    
+    def _sync_rolling_cells(self):
+        """Rebuild the set of cells currently occupied by rolling obstacles."""
+        self._rolling_cells = {(obstacle.grid_x << 16) | obstacle.grid_y
+                               for obstacle in self.rolling_obstacles}
     
     def add_static_obstacles(self):
         """Add static obstacles that increase with level difficulty."""
@@ -207,21 +246,34 @@ class Level:
             
         static_obstacle_count = min((self.level_number - 2) * 2, 8)  # Cap at 8 obstacles
         
-        for _ in range(static_obstacle_count):
-            # Try to place static obstacle
-            for _ in range(50):  
-                x = random.randint(2, self.width - 3)
-                y = random.randint(2, self.height - 3)
-                
-                if (self.grid[y][x] == CellType.EMPTY and
-                    (x, y) not in self.cheese_positions and
-                    (x, y) not in self.goal_positions and
-                    not (x < 4 and y < 4) and  # Avoid starting area
-                    not (x > self.width - 5 and y > self.height - 5)):  # Avoid goal area
-                    
-                    self.grid[y][x] = CellType.OBSTACLE
-                    self.obstacle_positions.add((x, y))
-                    break
+        # EMPTY cells never hold cheese or the goal
+        candidates = [(x, y) for x, y in self.empty_cells(2, 2, self.width - 3, self.height - 3)
+                      if not (x < 4 and y < 4) and  # Avoid starting area
+                      not (x > self.width - 5 and y > self.height - 5)]  # Avoid goal area
+        
+        for x, y in self._rng.sample(candidates, min(static_obstacle_count, len(candidates))):
+            self.grid[y][x] = CellType.OBSTACLE
+            self.obstacle_positions.add((x, y))
+    
+    def empty_cells(self, x0: int, y0: int, x1: int, y1: int) -> List[Tuple[int, int]]:
+        """
+        List the EMPTY cells inside a rectangle.
+        
+        Args:
+            x0: First grid column (inclusive)
+            y0: First grid row (inclusive)
+            x1: Last grid column (inclusive)
+            y1: Last grid row (inclusive)
+            
+        Returns:
+            List of (x, y) positions in row-major order
+        """
+        cells = []
+        for y in range(y0, y1 + 1):
+            row = self.grid[y]
+            cells.extend((x, y) for x in range(x0, x1 + 1) if row[x] == EMPTY)
+        
+        return cells
     
     def is_wall(self, x: int, y: int) -> bool:
         """
@@ -234,19 +286,46 @@ class Level:
         Returns:
             True if position is blocked, False otherwise
         """
-        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+        if not (0 <= x < self.width and 0 <= y < self.height):
             return True
         
-        # Check static walls and obstacles
-        if self.grid[y][x] in [CellType.WALL, CellType.OBSTACLE]:
-            return True
+        # Check static walls and obstacles, then rolling obstacles
+        return (self.wall_mask[(y + 1) * self.wall_stride + x + 1] != 0 or
+                ((x << 16) | y) in self._rolling_cells)
+    
+    def is_area_empty(self, x: int, y: int, width: int, height: int) -> bool:
+        """
+        Check if every cell in a rectangle is empty.
         
-        # Check rolling obstacles
-        for obstacle in self.rolling_obstacles:
-            if obstacle.grid_x == x and obstacle.grid_y == y:
-                return True
+        Args:
+            x: Left grid X position
+            y: Top grid Y position
+            width: Rectangle width in cells
+            height: Rectangle height in cells
+            
+        Returns:
+            True if all cells are EMPTY, False otherwise
+        """
+        # EMPTY is zero, so each row slice compares against a zero run in C
+        empty_run = bytes(width)
+        for row in self.grid[y:y + height]:
+            if row[x:x + width] != empty_run:
+                return False
         
-        return False
+        return True
+    
+    def has_rolling_obstacle(self, x: int, y: int) -> bool:
+        """
+        Check if a rolling obstacle currently occupies position.
+        
+        Args:
+            x: Grid X position
+            y: Grid Y position
+            
+        Returns:
+            True if a rolling obstacle is there, False otherwise
+        """
+        return ((x << 16) | y) in self._rolling_cells
     
     def collect_cheese(self, x: int, y: int) -> bool:
         """
@@ -261,7 +340,9 @@ class Level:
         """
         if (x, y) in self.cheese_positions:
             self.cheese_positions.remove((x, y))
+            self._cheese_remaining -= 1
             self.grid[y][x] = CellType.EMPTY
+            self.repaint_cell(x, y)
             return True
         return False
     
@@ -277,13 +358,18 @@ class Level:
             True if player has won, False otherwise
         """
         # Must be at goal and have collected all cheese
-        return (x, y) in self.goal_positions and len(self.cheese_positions) == 0
+        return self._cheese_remaining == 0 and (x, y) == self._goal_xy
     
     def update(self):
         """Update dynamic level elements."""
-        # Update rolling obstacles
+        # Update rolling obstacles, refreshing occupancy only after a step
+        moved = False
         for obstacle in self.rolling_obstacles:
-            obstacle.update(self)
+            if obstacle.update(self):
+                moved = True
+        
+        if moved:
+            self._sync_rolling_cells()
     
     def draw(self, screen: pygame.Surface):
         """
@@ -292,27 +378,82 @@ class Level:
         Args:
             screen: Pygame surface to draw on
         """
-        # Draw grid cells
-        for y in range(self.height):
-            for x in range(self.width):
-                cell_type = self.grid[y][x]
-                color = self.colors[cell_type]
+        # Draw the cached static cells
+        screen.blit(self._background, (0, 0))
+        
+        # Draw rolling obstacles
+        for obstacle in self.rolling_obstacles:
+            obstacle.draw(screen)
+    
+    def render_background(self):
+        """Rasterize every grid cell into the cached background surface."""
+        size = (self.width * self.grid_size, self.height * self.grid_size)
+        self._background = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self._background = self._background.convert()
+        
+        self.draw_cells(self._background, 0, 0, self.width, self.height)
+    
+    def repaint_cell(self, x: int, y: int):
+        """
+        Redraw one cell of the cached background after it changes.
+        
+        Neighbouring cell art can spill a pixel or two across the cell edge,
+        so the surrounding cells are redrawn too, clipped to the changed cell,
+        in the same order a full render would use.
+        
+        Args:
+            x: Grid X position
+            y: Grid Y position
+        """
+        background = self._background
+        background.set_clip(pygame.Rect(x * self.grid_size, y * self.grid_size,
+                                        self.grid_size, self.grid_size))
+        self.draw_cells(background, max(0, x - 1), max(0, y - 1),
+                        min(self.width, x + 2), min(self.height, y + 2))
+        background.set_clip(None)
+    
+    def draw_cells(self, surface: pygame.Surface, x0: int, y0: int, x1: int, y1: int):
+        """
+        Draw the static grid cells in the given range.
+        
+        Args:
+            surface: Pygame surface to draw on
+            x0: First grid column (inclusive)
+            y0: First grid row (inclusive)
+            x1: Last grid column (exclusive)
+            y1: Last grid row (exclusive)
+        """
+        # Floor cells all share one color, so fill the whole range at once
+        grid = self.grid
+        grid_size = self.grid_size
+        palette = self._palette
+        draw_rect = pygame.draw.rect
+        draw_content = self.draw_cell_content
+        surface.fill(palette[EMPTY],
+                     (x0 * grid_size, y0 * grid_size,
+                      (x1 - x0) * grid_size, (y1 - y0) * grid_size))
+        
+        for y in range(y0, y1):
+            row = grid[y]
+            for x in range(x0, x1):
+                cell_type = row[x]
+                if cell_type == EMPTY:
+                    continue
                 
-                rect = pygame.Rect(x * self.grid_size, y * self.grid_size,
-                                 self.grid_size, self.grid_size)
-                pygame.draw.rect(screen, color, rect)
+                color = palette[cell_type]
+                
+                rect = pygame.Rect(x * grid_size, y * grid_size,
+                                 grid_size, grid_size)
+                draw_rect(surface, color, rect)
                 
                 # Draw wall borders
-                if cell_type == CellType.WALL:
+                if cell_type == WALL:
                     border_color = (200, 162, 200)  # Purple border
-                    pygame.draw.rect(screen, border_color, rect, 2)
+                    draw_rect(surface, border_color, rect, 2)
                 
                 # Draw special cell contents
-                self.draw_cell_content(screen, x, y, cell_type)
-        
-        # Draw rolling obstacles
-        for obstacle in self.rolling_obstacles:
-            obstacle.draw(screen)
+                draw_content(surface, x, y, cell_type)
     
     def draw_cell_content(self, screen: pygame.Surface, x: int, y: int, cell_type: CellType):
         """
@@ -324,8 +465,41 @@ class Level:
             y: Grid Y position  
             cell_type: Type of cell to draw
         """
-        pixel_x = x * self.grid_size
-        pixel_y = y * self.grid_size
+        sprite = self._cell_sprites.get(cell_type)
+        if sprite is not None:
+            screen.blit(sprite, (x * self.grid_size - CELL_SPRITE_PADDING,
+                                 y * self.grid_size - CELL_SPRITE_PADDING))
+    
+    def _bake_cell_sprite(self, cell_type: CellType) -> pygame.Surface:
+        """
+        Render the art for a decorated cell type into a transparent sprite.
+        
+        Args:
+            cell_type: Type of cell to render
+            
+        Returns:
+            Sprite padded by CELL_SPRITE_PADDING on each side
+        """
+        side = self.grid_size + 2 * CELL_SPRITE_PADDING
+        sprite = pygame.Surface((side, side), pygame.SRCALPHA)
+        self._draw_cell_art(sprite, CELL_SPRITE_PADDING, CELL_SPRITE_PADDING, cell_type)
+        
+        # Match the display format so blits skip per-pixel conversion
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+    
+    def _draw_cell_art(self, screen: pygame.Surface, pixel_x: int, pixel_y: int,
+                       cell_type: CellType):
+        """
+        Draw the primitives making up a decorated cell.
+        
+        Args:
+            screen: Pygame surface to draw on
+            pixel_x: Left edge of the cell in pixels
+            pixel_y: Top edge of the cell in pixels
+            cell_type: Type of cell to draw
+        """
         center_x = pixel_x + self.grid_size // 2
         center_y = pixel_y + self.grid_size // 2
         
@@ -399,6 +573,25 @@ class Level:
 class RollingObstacle:
     """A rolling tomato obstacle that moves in a fixed pattern."""
     
+    __slots__ = (
+        'grid_x', 'grid_y', 'dx', 'dy', 'grid_size',
+        'move_timer', 'move_delay',
+        'color', 'size',
+        'rotation', 'rotation_speed',
+        '_frames',
+    )
+    
+    # Stem tip offsets for every 5 degree rotation step (stem length 8)
+    _STEM_OFFSETS = tuple(
+        (int(8 * math.cos(angle * (3.14159 / 180))),
+         int(8 * math.sin(angle * (3.14159 / 180))))
+        for angle in range(0, 360, 5)
+    )
+    
+    # Pre-rendered tomato frames, one per stem rotation step, shared by all
+    # obstacles with the same cell size and color
+    _frame_cache: Dict[Tuple[int, Tuple[int, int, int]], Tuple[pygame.Surface, ...]] = {}
+    
     def __init__(self, grid_x: int, grid_y: int, direction: Tuple[int, int], grid_size: int):
         """
         Initialize rolling obstacle.
@@ -411,7 +604,7 @@ class RollingObstacle:
         """
         self.grid_x = grid_x
         self.grid_y = grid_y
-        self.direction = direction
+        self.dx, self.dy = direction
         self.grid_size = grid_size
         
         # Movement timing
@@ -425,6 +618,61 @@ class RollingObstacle:
         # Animation
         self.rotation = 0
         self.rotation_speed = 5
+        
+        # Pre-rendered frames for every stem rotation
+        key = (grid_size, self.color)
+        if key not in self._frame_cache:
+            self._frame_cache[key] = tuple(self._bake_frame(offset_x, offset_y)
+                                           for offset_x, offset_y in self._STEM_OFFSETS)
+        self._frames = self._frame_cache[key]
+    
+    @property
+    def direction(self) -> Tuple[int, int]:
+        """Get the current movement direction as (dx, dy)."""
+        return (self.dx, self.dy)
+    
+    def _bake_frame(self, stem_x: int, stem_y: int) -> pygame.Surface:
+        """
+        Render the tomato with its stem at one rotation into a transparent sprite.
+        
+        Args:
+            stem_x: Stem tip X offset from the center
+            stem_y: Stem tip Y offset from the center
+            
+        Returns:
+            Sprite of one grid cell, drawn relative to the cell's top-left corner
+        """
+        sprite = pygame.Surface((self.grid_size, self.grid_size), pygame.SRCALPHA)
+        center_x = self.grid_size // 2
+        center_y = self.grid_size // 2
+        
+        # Draw tomato body
+        pygame.draw.circle(sprite, self.color, (center_x, center_y), self.size // 2)
+        
+        # Draw highlight
+        highlight_color = (255, 218, 224)  # Pink highlight
+        pygame.draw.circle(sprite, highlight_color, 
+                         (center_x - 3, center_y - 3), self.size // 4)
+        
+        # Add face to tomato
+        # Eyes
+        pygame.draw.circle(sprite, (0, 0, 0), (center_x - 4, center_y - 2), 1)
+        pygame.draw.circle(sprite, (0, 0, 0), (center_x + 4, center_y - 2), 1)
+        
+        # Smile
+        pygame.draw.arc(sprite, (0, 0, 0), 
+                      (center_x - 3, center_y + 1, 6, 4), 0, 3.14159, 1)
+        
+        # Draw stem
+        stem_color = (152, 251, 152)  # Green
+        pygame.draw.line(sprite, stem_color, 
+                        (center_x, center_y), 
+                        (center_x + stem_x, center_y + stem_y), 3)
+        
+        # Match the display format so blits skip per-pixel conversion
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
     
     @property
     def pixel_x(self) -> int:
@@ -436,12 +684,15 @@ class RollingObstacle:
         """Get pixel Y position."""
         return self.grid_y * self.grid_size
     
-    def update(self, level: 'Level'):
+    def update(self, level: 'Level') -> bool:
         """
         Update obstacle movement.
         
         Args:
             level: Current level for collision checking
+            
+        Returns:
+            True if the obstacle moved to a new cell, False otherwise
         """
         # Update animation
         self.rotation += self.rotation_speed
@@ -450,23 +701,28 @@ class RollingObstacle:
         
         # Update movement
         self.move_timer += 1
-        if self.move_timer >= self.move_delay:
-            self.move_timer = 0
-            
-            # Calculate next position
-            next_x = self.grid_x + self.direction[0]
-            next_y = self.grid_y + self.direction[1]
+        if self.move_timer < self.move_delay:
+            return False
+        
+        self.move_timer = 0
+        
+        # Calculate next position
+        next_x = self.grid_x + self.dx
+        next_y = self.grid_y + self.dy
+        
+        # Check if next position is valid
+        if (0 < next_x < level.width - 1 and 
+            0 < next_y < level.height - 1 and
+            level.grid[next_y][next_x] != WALL):
             
-            # Check if next position is valid
-            if (0 < next_x < level.width - 1 and 
-                0 < next_y < level.height - 1 and
-                level.grid[next_y][next_x] != CellType.WALL):
-                
-                self.grid_x = next_x
-                self.grid_y = next_y
-            else:
-                # Reverse direction if hit wall
-                self.direction = (-self.direction[0], -self.direction[1])
+            self.grid_x = next_x
+            self.grid_y = next_y
+            return True
+        
+        # Reverse direction if hit wall
+        self.dx = -self.dx
+        self.dy = -self.dy
+        return False
     
     def draw(self, screen: pygame.Surface):
         """
@@ -475,35 +731,5 @@ class RollingObstacle:
         Args:
             screen: Pygame surface to draw on
         """
-        center_x = self.pixel_x + self.grid_size // 2
-        center_y = self.pixel_y + self.grid_size // 2
-        
-        # Draw tomato body
-        pygame.draw.circle(screen, self.color, (center_x, center_y), self.size // 2)
-        
-        # Draw highlight
-        highlight_color = (255, 218, 224)  # Pink highlight
-        pygame.draw.circle(screen, highlight_color, 
-                         (center_x - 3, center_y - 3), self.size // 4)
-        
-        # Draw stem
-        stem_color = (152, 251, 152)  # Green
-        stem_length = 8
-        stem_angle = self.rotation * (3.14159 / 180)  
-        
-        import math
-        stem_end_x = center_x + int(stem_length * math.cos(stem_angle))
-        stem_end_y = center_y + int(stem_length * math.sin(stem_angle))
-        
-        # Add face to tomato
-        # Eyes
-        pygame.draw.circle(screen, (0, 0, 0), (center_x - 4, center_y - 2), 1)
-        pygame.draw.circle(screen, (0, 0, 0), (center_x + 4, center_y - 2), 1)
-        
-        # Smile
-        pygame.draw.arc(screen, (0, 0, 0), 
-                      (center_x - 3, center_y + 1, 6, 4), 0, 3.14159, 1)
-        
-        pygame.draw.line(screen, stem_color, 
-                        (center_x, center_y), 
-                        (stem_end_x, stem_end_y), 3) 
\ No newline at end of file
+        # Draw the tomato frame for the current stem rotation
+        screen.blit(self._frames[(self.rotation // 5) % 72], (self.pixel_x, self.pixel_y)) 
\ No newline at end of file
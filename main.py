@@ -25,6 +25,28 @@ class GameState(Enum):
     VICTORY = "victory"
 
 
+# Events after which the window contents must be redrawn in full
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+
+# Event types the game reacts to
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, *EXPOSE_EVENTS]
+
+# Grid step for each movement key (arrows and WASD)
+KEY_DIRECTIONS = {
+    pygame.K_UP: (0, -1), pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1),
+    pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+}
+
+# Fixed phase offsets of the title decorations as (cos, sin) pairs, so each
+# frame needs only one sin/cos per animation instead of one per decoration
+HEART_ORBIT_PHASES = [(math.cos(i * math.pi / 3), math.sin(i * math.pi / 3)) for i in range(6)]
+HEART_BOB_PHASES = [(math.cos(0.7 * i * math.pi / 3), math.sin(0.7 * i * math.pi / 3)) for i in range(6)]
+HEART_PULSE_PHASES = [(math.cos(i), math.sin(i)) for i in range(6)]
+SPARKLE_PULSE_PHASES = [(math.cos(i), math.sin(i)) for i in range(4)]
+
+
 class Game:
     """Main game class handling game loop and state management."""
     
@@ -52,12 +74,22 @@ class Game:
     def __init__(self):
         """Initialize the game."""
         pygame.init()
-        pygame.mixer.init()
+        
+        # Audio is optional; without a device the game runs silently
+        try:
+            pygame.mixer.init()
+            self.audio_enabled = True
+        except pygame.error:
+            self.audio_enabled = False
         
         # Create game window
         self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
         pygame.display.set_caption("Pawsuit")
         
+        # Only quit, key presses and expose events matter; keep everything else off the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+        
         # Game clock
         self.clock = pygame.time.Clock()
         
@@ -70,21 +102,25 @@ class Game:
         # Load fonts 
         self.load_fonts()
         
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache = {}
+        
+        # Cropped menu text layers keyed by (draw method, score, level)
+        self._text_layers = {}
+        
         # Load sounds 
         self.sounds = {}
-        try:
-            self.sounds['move'] = pygame.mixer.Sound('assets/sounds/move.wav')
-            self.sounds['collect'] = pygame.mixer.Sound('assets/sounds/collect.wav')
-            self.sounds['caught'] = pygame.mixer.Sound('assets/sounds/caught.wav')
-            self.sounds['victory'] = pygame.mixer.Sound('assets/sounds/victory.wav')
-        except pygame.error:
-            # Create silent sounds as fallback
-            self.sounds = {
-                'move': pygame.mixer.Sound(buffer=b'\x00' * 44100),
-                'collect': pygame.mixer.Sound(buffer=b'\x00' * 44100),
-                'caught': pygame.mixer.Sound(buffer=b'\x00' * 44100),
-                'victory': pygame.mixer.Sound(buffer=b'\x00' * 44100)
-            }
+        if self.audio_enabled:
+            try:
+                self.sounds['move'] = pygame.mixer.Sound('assets/sounds/move.wav')
+                self.sounds['collect'] = pygame.mixer.Sound('assets/sounds/collect.wav')
+                self.sounds['caught'] = pygame.mixer.Sound('assets/sounds/caught.wav')
+                self.sounds['victory'] = pygame.mixer.Sound('assets/sounds/victory.wav')
+            except (pygame.error, FileNotFoundError):
+                # Run silently rather than mixing empty buffers
+                self.sounds = {}
+                self.audio_enabled = False
+                pygame.mixer.quit()
         
         # Initialize particle system
         self.particles = ParticleSystem()
@@ -92,6 +128,14 @@ class Game:
         # Background animation
         self.bg_animation_timer = 0
         
+        # Screen regions pushed to the display on the previous frame, and the
+        # (state, level) they were collected for
+        self._dirty_rects = []
+        self._dirty_key = None
+        
+        # Area the mouse sprite covered when last drawn
+        self._mouse_rect = pygame.Rect(0, 0, 0, 0)
+        
         # Initialize game objects
         self.reset_game()
     
@@ -144,6 +188,69 @@ class Game:
                 self.font_medium = pygame.font.Font(None, 32)
                 self.font_small = pygame.font.Font(None, 24)
     
+    def play_sound(self, name: str):
+        """
+        Play a sound effect if audio is available.
+        
+        Args:
+            name: Key of the sound in self.sounds
+        """
+        if self.audio_enabled:
+            self.sounds[name].play()
+    
+    def render_text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """
+        Render antialiased text, reusing the surface from earlier frames.
+        
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: RGB text color
+            
+        Returns:
+            Surface containing the rendered text
+        """
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Score text keeps changing, so keep the cache from growing unbounded
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
+    def blit_text_layer(self, draw_text):
+        """
+        Blit a menu's text from a cached, pre-composited layer.
+        
+        The layer is rebuilt only when the score or level shown on it changes.
+        
+        Args:
+            draw_text: Method that draws the menu text onto a surface
+        """
+        key = (draw_text.__name__, self.score, self.level_number)
+        cached = self._text_layers.get(key)
+        if cached is None:
+            if len(self._text_layers) >= 8:
+                self._text_layers.clear()
+            
+            # Menus sit on a black background, so blend the antialiased text
+            # onto opaque black once and key the untouched black back out
+            layer = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT)).convert()
+            layer.fill(self.BLACK)
+            draw_text(layer)
+            layer.set_colorkey(self.BLACK)
+            
+            # Keep only the area the text covers
+            bounds = layer.get_bounding_rect()
+            text_layer = layer.subsurface(bounds).copy()
+            text_layer.set_colorkey(self.BLACK, pygame.RLEACCEL)
+            cached = (text_layer, bounds.topleft)
+            self._text_layers[key] = cached
+        
+        self.screen.blit(*cached)
+    
     def reset_game(self, complete_reset=True):
         """Reset game to starting state."""
         if complete_reset:
@@ -172,8 +279,11 @@ class Game:
     
     def handle_events(self):
         """Handle pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in pygame.event.get(HANDLED_EVENTS):
+            if event.type in EXPOSE_EVENTS:
+                # The window was uncovered or restored; flip the whole screen next draw
+                self._dirty_key = None
+            elif event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if self.state == GameState.TITLE:
@@ -188,36 +298,32 @@ class Game:
                         self.reset_game(complete_reset=True)
                     elif event.key == pygame.K_SPACE:  # SPACE to go to home menu
                         self.state = GameState.TITLE
+                        # The title screen shows no particles, so don't keep simulating them
+                        self.particles.clear()
                 elif self.state == GameState.VICTORY:
                     if event.key == pygame.K_RETURN:  # ENTER to continue to next level
                         self.state = GameState.PLAYING
     
     def handle_game_input(self, key):
         """Handle input during gameplay."""
-        old_pos = (self.mouse.grid_x, self.mouse.grid_y)
-        
-        if key in [pygame.K_UP, pygame.K_w]:
-            self.mouse.move(0, -1, self.level)
-        elif key in [pygame.K_DOWN, pygame.K_s]:
-            self.mouse.move(0, 1, self.level)
-        elif key in [pygame.K_LEFT, pygame.K_a]:
-            self.mouse.move(-1, 0, self.level)
-        elif key in [pygame.K_RIGHT, pygame.K_d]:
-            self.mouse.move(1, 0, self.level)
+        direction = KEY_DIRECTIONS.get(key)
+        if direction is None:
+            return
         
         # Play move sound if position changed
-        if (self.mouse.grid_x, self.mouse.grid_y) != old_pos:
-            self.sounds['move'].play()
+        if self.mouse.move(direction[0], direction[1], self.level):
+            self.play_sound('move')
             # Add trail
-            mouse_center_x = self.mouse.pixel_x + self.GRID_SIZE // 2
-            mouse_center_y = self.mouse.pixel_y + self.GRID_SIZE // 2
-            self.particles.add_sparkle_trail(mouse_center_x, mouse_center_y, 2)
+            self.particles.add_sparkle_trail(*self.mouse.center, 2)
     
     def update(self):
         """Update game logic."""
         # Update particles in all states
         self.particles.update()
-        self.bg_animation_timer += 1
+        
+        # Only the title screen animates with the background timer
+        if self.state == GameState.TITLE:
+            self.bg_animation_timer += 1
         
         if self.state == GameState.PLAYING:
             # Update level (rolling obstacles)
@@ -229,53 +335,47 @@ class Game:
             # Add ambient twinkles 
             self.particles.add_ambient_twinkles(self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
             
+            mouse_x = self.mouse.grid_x
+            mouse_y = self.mouse.grid_y
+            
             # Check collision with cat
-            if (self.mouse.grid_x == self.cat.grid_x and 
-                self.mouse.grid_y == self.cat.grid_y):
-                self.sounds['caught'].play()
+            if mouse_x == self.cat.grid_x and mouse_y == self.cat.grid_y:
+                self.play_sound('caught')
                 # Add heart burst effect 
-                cat_center_x = self.cat.pixel_x + self.GRID_SIZE // 2
-                cat_center_y = self.cat.pixel_y + self.GRID_SIZE // 2
-                self.particles.add_heart_burst(cat_center_x, cat_center_y, 8)
+                self.particles.add_heart_burst(*self.cat.center, 8)
                 self.state = GameState.GAME_OVER
             
             # Check collision with rolling obstacles
-            for obstacle in self.level.rolling_obstacles:
-                if (self.mouse.grid_x == obstacle.grid_x and 
-                    self.mouse.grid_y == obstacle.grid_y):
-                    self.sounds['caught'].play()
-                    # Add heart burst 
-                    obstacle_center_x = obstacle.pixel_x + self.GRID_SIZE // 2
-                    obstacle_center_y = obstacle.pixel_y + self.GRID_SIZE // 2
-                    self.particles.add_heart_burst(obstacle_center_x, obstacle_center_y, 5)
-                    self.state = GameState.GAME_OVER
+            elif self.level.has_rolling_obstacle(mouse_x, mouse_y):
+                self.play_sound('caught')
+                # Add heart burst at the shared cell
+                self.particles.add_heart_burst(*self.mouse.center, 5)
+                self.state = GameState.GAME_OVER
             
             # Check collision with static obstacles
-            if (self.mouse.grid_x, self.mouse.grid_y) in self.level.obstacle_positions:
-                self.sounds['caught'].play()
+            elif (mouse_x, mouse_y) in self.level.obstacle_positions:
+                self.play_sound('caught')
                 # Add heart burst effect at obstacle
-                mouse_center_x = self.mouse.pixel_x + self.GRID_SIZE // 2
-                mouse_center_y = self.mouse.pixel_y + self.GRID_SIZE // 2
-                self.particles.add_heart_burst(mouse_center_x, mouse_center_y, 5)
+                self.particles.add_heart_burst(*self.mouse.center, 5)
                 self.state = GameState.GAME_OVER
             
+            # A caught mouse can't collect cheese or win this frame
+            if self.state == GameState.GAME_OVER:
+                return
+            
             # Check cheese collection
-            cheese_collected = self.level.collect_cheese(self.mouse.grid_x, self.mouse.grid_y)
+            cheese_collected = self.level.collect_cheese(mouse_x, mouse_y)
             if cheese_collected:
-                self.sounds['collect'].play()
+                self.play_sound('collect')
                 self.score += 10
                 # Add collection effect
-                mouse_center_x = self.mouse.pixel_x + self.GRID_SIZE // 2
-                mouse_center_y = self.mouse.pixel_y + self.GRID_SIZE // 2
-                self.particles.add_collect_effect(mouse_center_x, mouse_center_y)
+                self.particles.add_collect_effect(*self.mouse.center)
             
             # Check victory condition
-            if self.level.check_victory(self.mouse.grid_x, self.mouse.grid_y):
-                self.sounds['victory'].play()
+            if self.level.check_victory(mouse_x, mouse_y):
+                self.play_sound('victory')
                 # Add victory celebration
-                mouse_center_x = self.mouse.pixel_x + self.GRID_SIZE // 2
-                mouse_center_y = self.mouse.pixel_y + self.GRID_SIZE // 2
-                self.particles.add_heart_burst(mouse_center_x, mouse_center_y, 15)
+                self.particles.add_heart_burst(*self.mouse.center, 15)
                 # Level progression: advance to next level
                 self.advance_to_next_level()
     
@@ -287,6 +387,22 @@ class Game:
         # Draw decorative hearts 
         self.draw_title_decorations()
         
+        # Pre-composited title, subtitle, instructions and start prompt
+        self.blit_text_layer(self.draw_title_text)
+        
+        # Add blinking effect to start text
+        if (self.bg_animation_timer // 30) % 2:  # Blink every 30 frames
+            sparkle_text = self.render_text(self.font_small, "✨ ✨ ✨", self.BABY_BLUE)
+            sparkle_rect = sparkle_text.get_rect(center=(self.WINDOW_WIDTH // 2, 500))
+            self.screen.blit(sparkle_text, sparkle_rect)
+    
+    def draw_title_text(self, surface: pygame.Surface):
+        """
+        Draw the static text of the title screen.
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
         # Main title 
         title_text = "PAWSUIT"
         title_color = self.LILAC  
@@ -296,19 +412,19 @@ class Game:
         
         # Draw outline
         for offset_x, offset_y in outline_offsets:
-            outline_surface = self.font_title.render(title_text, True, outline_color)
+            outline_surface = self.render_text(self.font_title, title_text, outline_color)
             outline_rect = outline_surface.get_rect(center=(self.WINDOW_WIDTH // 2 + offset_x, 200 + offset_y))
-            self.screen.blit(outline_surface, outline_rect)
+            surface.blit(outline_surface, outline_rect)
         
         # Draw main title text
-        main_title = self.font_title.render(title_text, True, title_color)
+        main_title = self.render_text(self.font_title, title_text, title_color)
         title_rect = main_title.get_rect(center=(self.WINDOW_WIDTH // 2, 200))
-        self.screen.blit(main_title, title_rect)
+        surface.blit(main_title, title_rect)
         
         # Subtitle 
-        subtitle_text = self.font_medium.render("♡ Mouse Adventure ♡", True, self.SOFT_PINK)
+        subtitle_text = self.render_text(self.font_medium, "♡ Mouse Adventure ♡", self.SOFT_PINK)
         subtitle_rect = subtitle_text.get_rect(center=(self.WINDOW_WIDTH // 2, 260))
-        self.screen.blit(subtitle_text, subtitle_rect)
+        surface.blit(subtitle_text, subtitle_rect)
         
         # Instructions 
         instructions = [
@@ -319,41 +435,42 @@ class Game:
         
         y_offset = 350
         for instruction in instructions:
-            text = self.font_small.render(instruction, True, self.WHITE)
+            text = self.render_text(self.font_small, instruction, self.WHITE)
             text_rect = text.get_rect(center=(self.WINDOW_WIDTH // 2, y_offset))
-            self.screen.blit(text, text_rect)
+            surface.blit(text, text_rect)
             y_offset += 30
         
         # Start button 
-        start_text = self.font_medium.render("Press ENTER to start", True, self.LILAC)
+        start_text = self.render_text(self.font_medium, "Press ENTER to start", self.LILAC)
         start_rect = start_text.get_rect(center=(self.WINDOW_WIDTH // 2, 480))
         
         # Add a glow effect to the start text
-        glow_surface = self.font_medium.render("Press ENTER to start", True, self.SOFT_PINK)
+        glow_surface = self.render_text(self.font_medium, "Press ENTER to start", self.SOFT_PINK)
         for glow_offset in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
             glow_rect = glow_surface.get_rect(center=(self.WINDOW_WIDTH // 2 + glow_offset[0], 480 + glow_offset[1]))
-            self.screen.blit(glow_surface, glow_rect)
-        
-        self.screen.blit(start_text, start_rect)
+            surface.blit(glow_surface, glow_rect)
         
-        # Add blinking effect to start text
-        if (self.bg_animation_timer // 30) % 2:  # Blink every 30 frames
-            sparkle_text = self.font_small.render("✨ ✨ ✨", True, self.BABY_BLUE)
-            sparkle_rect = sparkle_text.get_rect(center=(self.WINDOW_WIDTH // 2, 500))
-            self.screen.blit(sparkle_text, sparkle_rect)
+        surface.blit(start_text, start_rect)
     
     def draw_title_decorations(self):
         """Draw decorative elements for the title screen."""
-        import math
+        timer = self.bg_animation_timer
+        
+        # Animation angles shared by all decorations
+        orbit = timer * 0.02
+        orbit_cos, orbit_sin = math.cos(orbit), math.sin(orbit)
+        bob_cos, bob_sin = math.cos(orbit * 0.7), math.sin(orbit * 0.7)
+        pulse_cos, pulse_sin = math.cos(timer * 0.05), math.sin(timer * 0.05)
         
         # Animated floating hearts
-        for i in range(6):
-            angle = (self.bg_animation_timer * 0.02) + (i * math.pi / 3)
-            heart_x = self.WINDOW_WIDTH // 2 + int(250 * math.cos(angle))
-            heart_y = 300 + int(80 * math.sin(angle * 0.7))
+        for (orbit_c, orbit_s), (bob_c, bob_s), (pulse_c, pulse_s) in zip(
+                HEART_ORBIT_PHASES, HEART_BOB_PHASES, HEART_PULSE_PHASES):
+            # cos/sin of (animation angle + phase offset)
+            heart_x = self.WINDOW_WIDTH // 2 + int(250 * (orbit_cos * orbit_c - orbit_sin * orbit_s))
+            heart_y = 300 + int(80 * (bob_sin * bob_c + bob_cos * bob_s))
             
             # Draw heart
-            heart_size = 8 + int(3 * math.sin(self.bg_animation_timer * 0.05 + i))
+            heart_size = 8 + int(3 * (pulse_sin * pulse_c + pulse_cos * pulse_s))
             pygame.draw.circle(self.screen, self.SOFT_PINK, (heart_x - 2, heart_y - 2), heart_size // 2)
             pygame.draw.circle(self.screen, self.SOFT_PINK, (heart_x + 2, heart_y - 2), heart_size // 2)
             pygame.draw.polygon(self.screen, self.SOFT_PINK, 
@@ -362,9 +479,10 @@ class Game:
                                (heart_x + heart_size//2, heart_y)])
         
         # Corner sparkles
+        sparkle_cos, sparkle_sin = math.cos(timer * 0.1), math.sin(timer * 0.1)
         sparkle_positions = [(50, 50), (750, 50), (50, 550), (750, 550)]
-        for i, (x, y) in enumerate(sparkle_positions):
-            sparkle_size = 3 + int(2 * math.sin(self.bg_animation_timer * 0.1 + i))
+        for (x, y), (phase_c, phase_s) in zip(sparkle_positions, SPARKLE_PULSE_PHASES):
+            sparkle_size = 3 + int(2 * (sparkle_sin * phase_c + sparkle_cos * phase_s))
             # Draw sparkle cross
             pygame.draw.line(self.screen, self.BABY_BLUE, 
                            (x - sparkle_size, y), (x + sparkle_size, y), 2)
@@ -379,17 +497,17 @@ class Game:
         self.level.draw(self.screen)
         
         # Draw game objects
-        self.mouse.draw(self.screen)
+        self._mouse_rect = self.mouse.draw(self.screen)
         self.cat.draw(self.screen)
         
         # Draw particles
         self.particles.draw(self.screen)
         
         # Draw HUD with heart decorations
-        score_text = self.font_small.render(f"♡ Score: {self.score} ♡", True, self.SOFT_PINK)
+        score_text = self.render_text(self.font_small, f"♡ Score: {self.score} ♡", self.SOFT_PINK)
         self.screen.blit(score_text, (10, 10))
         
-        level_text = self.font_small.render(f"☆ Level: {self.level_number} ☆", True, self.LILAC)
+        level_text = self.render_text(self.font_small, f"☆ Level: {self.level_number} ☆", self.LILAC)
         self.screen.blit(level_text, (10, 35))
         
         # Draw grid (optional debug)
@@ -410,6 +528,16 @@ class Game:
         # Draw particles
         self.particles.draw(self.screen)
         
+        # Pre-composited title, score and instructions
+        self.blit_text_layer(self.draw_game_over_text)
+    
+    def draw_game_over_text(self, surface: pygame.Surface):
+        """
+        Draw the text of the game over screen.
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
         # Game Over title with outline effect like title screen
         title_text = "GAME OVER"
         title_color = self.LILAC
@@ -418,49 +546,49 @@ class Game:
         
         # Draw outline
         for offset_x, offset_y in outline_offsets:
-            outline_surface = self.font_large.render(title_text, True, outline_color)
+            outline_surface = self.render_text(self.font_large, title_text, outline_color)
             outline_rect = outline_surface.get_rect(center=(self.WINDOW_WIDTH // 2 + offset_x, 180 + offset_y))
-            self.screen.blit(outline_surface, outline_rect)
+            surface.blit(outline_surface, outline_rect)
         
         # Draw main title text
-        main_title = self.font_large.render(title_text, True, title_color)
+        main_title = self.render_text(self.font_large, title_text, title_color)
         title_rect = main_title.get_rect(center=(self.WINDOW_WIDTH // 2, 180))
-        self.screen.blit(main_title, title_rect)
+        surface.blit(main_title, title_rect)
         
         # Subtitle message
-        caught_text = self.font_medium.render("♡ The kitty caught you! ♡", True, self.SOFT_PINK)
+        caught_text = self.render_text(self.font_medium, "♡ The kitty caught you! ♡", self.SOFT_PINK)
         caught_rect = caught_text.get_rect(center=(self.WINDOW_WIDTH // 2, 240))
-        self.screen.blit(caught_text, caught_rect)
+        surface.blit(caught_text, caught_rect)
         
         # Score and level info
-        score_text = self.font_medium.render(f"Score: {self.score}", True, self.WHITE)
+        score_text = self.render_text(self.font_medium, f"Score: {self.score}", self.WHITE)
         score_rect = score_text.get_rect(center=(self.WINDOW_WIDTH // 2, 320))
-        self.screen.blit(score_text, score_rect)
+        surface.blit(score_text, score_rect)
         
-        level_text = self.font_medium.render(f"Level Reached: {self.level_number}", True, self.WHITE)
+        level_text = self.render_text(self.font_medium, f"Level Reached: {self.level_number}", self.WHITE)
         level_rect = level_text.get_rect(center=(self.WINDOW_WIDTH // 2, 350))
-        self.screen.blit(level_text, level_rect)
+        surface.blit(level_text, level_rect)
         
         # Instructions with glow effect like title screen
-        restart_text = self.font_medium.render("Press R to restart", True, self.LILAC)
+        restart_text = self.render_text(self.font_medium, "Press R to restart", self.LILAC)
         restart_rect = restart_text.get_rect(center=(self.WINDOW_WIDTH // 2, 400))
         
-        home_text = self.font_medium.render("Press SPACE for home menu", True, self.LILAC)
+        home_text = self.render_text(self.font_medium, "Press SPACE for home menu", self.LILAC)
         home_rect = home_text.get_rect(center=(self.WINDOW_WIDTH // 2, 440))
         
         # Add glow effect to both texts
-        glow_restart = self.font_medium.render("Press R to restart", True, self.SOFT_PINK)
+        glow_restart = self.render_text(self.font_medium, "Press R to restart", self.SOFT_PINK)
         for glow_offset in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
             glow_rect = glow_restart.get_rect(center=(self.WINDOW_WIDTH // 2 + glow_offset[0], 400 + glow_offset[1]))
-            self.screen.blit(glow_restart, glow_rect)
+            surface.blit(glow_restart, glow_rect)
         
-        glow_home = self.font_medium.render("Press SPACE for home menu", True, self.SOFT_PINK)
+        glow_home = self.render_text(self.font_medium, "Press SPACE for home menu", self.SOFT_PINK)
         for glow_offset in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
             glow_rect = glow_home.get_rect(center=(self.WINDOW_WIDTH // 2 + glow_offset[0], 440 + glow_offset[1]))
-            self.screen.blit(glow_home, glow_rect)
+            surface.blit(glow_home, glow_rect)
         
-        self.screen.blit(restart_text, restart_rect)
-        self.screen.blit(home_text, home_rect)
+        surface.blit(restart_text, restart_rect)
+        surface.blit(home_text, home_rect)
     
     def draw_victory_screen(self):
         """Draw the victory screen with black background matching title screen style."""
@@ -470,6 +598,16 @@ class Game:
         # Draw particles
         self.particles.draw(self.screen)
         
+        # Pre-composited title, score and instructions
+        self.blit_text_layer(self.draw_victory_text)
+    
+    def draw_victory_text(self, surface: pygame.Surface):
+        """
+        Draw the text of the victory screen.
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
         # Victory title with outline effect like title screen
         title_text = "YOU WIN!"
         title_color = self.LILAC
@@ -478,40 +616,75 @@ class Game:
         
         # Draw outline
         for offset_x, offset_y in outline_offsets:
-            outline_surface = self.font_large.render(title_text, True, outline_color)
+            outline_surface = self.render_text(self.font_large, title_text, outline_color)
             outline_rect = outline_surface.get_rect(center=(self.WINDOW_WIDTH // 2 + offset_x, 180 + offset_y))
-            self.screen.blit(outline_surface, outline_rect)
+            surface.blit(outline_surface, outline_rect)
         
         # Draw main title text
-        main_title = self.font_large.render(title_text, True, title_color)
+        main_title = self.render_text(self.font_large, title_text, title_color)
         title_rect = main_title.get_rect(center=(self.WINDOW_WIDTH // 2, 180))
-        self.screen.blit(main_title, title_rect)
+        surface.blit(main_title, title_rect)
         
         # Subtitle message
-        success_text = self.font_medium.render("♡ Level Complete! ♡", True, self.SOFT_PINK)
+        success_text = self.render_text(self.font_medium, "♡ Level Complete! ♡", self.SOFT_PINK)
         success_rect = success_text.get_rect(center=(self.WINDOW_WIDTH // 2, 240))
-        self.screen.blit(success_text, success_rect)
+        surface.blit(success_text, success_rect)
         
         # Score and level info
-        score_text = self.font_medium.render(f"Score: {self.score}", True, self.WHITE)
+        score_text = self.render_text(self.font_medium, f"Score: {self.score}", self.WHITE)
         score_rect = score_text.get_rect(center=(self.WINDOW_WIDTH // 2, 320))
-        self.screen.blit(score_text, score_rect)
+        surface.blit(score_text, score_rect)
         
-        level_text = self.font_medium.render(f"Starting Level: {self.level_number}", True, self.WHITE)
+        level_text = self.render_text(self.font_medium, f"Starting Level: {self.level_number}", self.WHITE)
         level_rect = level_text.get_rect(center=(self.WINDOW_WIDTH // 2, 350))
-        self.screen.blit(level_text, level_rect)
+        surface.blit(level_text, level_rect)
         
         # Instructions with glow effect like title screen
-        restart_text = self.font_medium.render("Press ENTER to continue", True, self.LILAC)
+        restart_text = self.render_text(self.font_medium, "Press ENTER to continue", self.LILAC)
         restart_rect = restart_text.get_rect(center=(self.WINDOW_WIDTH // 2, 420))
         
         # Add glow effect
-        glow_surface = self.font_medium.render("Press ENTER to continue", True, self.SOFT_PINK)
+        glow_surface = self.render_text(self.font_medium, "Press ENTER to continue", self.SOFT_PINK)
         for glow_offset in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
             glow_rect = glow_surface.get_rect(center=(self.WINDOW_WIDTH // 2 + glow_offset[0], 420 + glow_offset[1]))
-            self.screen.blit(glow_surface, glow_rect)
+            surface.blit(glow_surface, glow_rect)
+        
+        surface.blit(restart_text, restart_rect)
+    
+    def get_dirty_rects(self):
+        """
+        Collect the screen regions that can change between frames of the current screen.
+        
+        Returns:
+            List of rects covering the animated parts of the screen and particles
+        """
+        rects = self.particles.get_dirty_rects()
+        
+        if self.state == GameState.PLAYING:
+            # Cat art reaches past its cell (tail, ears, chase hearts)
+            reach = self.GRID_SIZE * 2
+            rects.append(pygame.Rect(0, 0, self.WINDOW_WIDTH, 64))  # HUD
+            rects.append(self._mouse_rect)
+            rects.append(self.cat.get_rect().inflate(reach, reach))
+            
+            for obstacle in self.level.rolling_obstacles:
+                rects.append(pygame.Rect(obstacle.pixel_x, obstacle.pixel_y,
+                                         self.GRID_SIZE, self.GRID_SIZE))
+        
+        elif self.state == GameState.TITLE:
+            # Band swept by the floating hearts
+            rects.append(pygame.Rect(140, 210, 521, 178))
+            
+            # Corner sparkles
+            for x, y in [(50, 50), (750, 50), (50, 550), (750, 550)]:
+                rects.append(pygame.Rect(x - 6, y - 6, 13, 13))
+            
+            # Blinking sparkle text
+            sparkle_text = self.render_text(self.font_small, "✨ ✨ ✨", self.BABY_BLUE)
+            rects.append(sparkle_text.get_rect(center=(self.WINDOW_WIDTH // 2, 500)))
         
-        self.screen.blit(restart_text, restart_rect)
+        # Game over and victory text is static, so only particles move there
+        return rects
     
     def draw(self):
         """Draw the current screen based on game state."""
@@ -524,7 +697,17 @@ class Game:
         elif self.state == GameState.VICTORY:
             self.draw_victory_screen()
         
-        pygame.display.flip()
+        # While the same screen stays up only animated parts change, so push
+        # last frame's regions (to erase) and this frame's regions (to draw)
+        dirty_rects = self.get_dirty_rects()
+        dirty_key = (self.state, self.level)
+        if self._dirty_key == dirty_key:
+            pygame.display.update(self._dirty_rects + dirty_rects)
+        else:
+            pygame.display.flip()
+        
+        self._dirty_rects = dirty_rects
+        self._dirty_key = dirty_key
     
     def run(self):
         """Main game loop."""
@@ -1,109 +1,298 @@
 """
 Particle effects system for Pawsuit game.
 
-Contains classes for creating particle effects like hearts, sparkles, and twinkles.
+Contains the particle system for effects like hearts, sparkles, and twinkles.
 """
 
 import pygame
 import math
 import random
-from typing import List, Tuple
-from enum import Enum
+from typing import List, Optional, Tuple
+from enum import IntEnum
 
 
-class ParticleType(Enum):
+class ParticleType(IntEnum):
     """Types of particles available."""
-    HEART = "heart"
-    SPARKLE = "sparkle"
-    TWINKLE = "twinkle"
-    COLLECT = "collect"
+    HEART = 0
+    SPARKLE = 1
+    TWINKLE = 2
+    COLLECT = 3
 
 
-class Particle:
-    """Individual particle with position, velocity, and lifecycle."""
+# Plain int particle types for the per-particle checks
+HEART = int(ParticleType.HEART)
+SPARKLE = int(ParticleType.SPARKLE)
+TWINKLE = int(ParticleType.TWINKLE)
+COLLECT = int(ParticleType.COLLECT)
+
+# Number of fade steps particles pass through as their life runs out
+PARTICLE_ALPHA_LEVELS = 16
+
+
+class ParticleSystem:
+    """Manages multiple particles and effects."""
+    
+    # Per-particle attributes, each stored as its own parallel list
+    _FIELDS = ('x', 'y', 'velocity_x', 'velocity_y', 'gravity', 'life', 'life_decay',
+               'size', 'pulse_timer', 'pulse_speed', 'particle_type', 'color')
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the particle system.
+        
+        Args:
+            seed: Optional seed for reproducible effects
+        """
+        # Particle-owned random source, kept apart from gameplay randomness
+        self._rng = random.Random(seed)
+        
+        # Particle state, one entry per live particle at the same index in every list
+        self.x: List[float] = []
+        self.y: List[float] = []
+        self.velocity_x: List[float] = []
+        self.velocity_y: List[float] = []
+        self.gravity: List[float] = []
+        self.life: List[float] = []
+        self.life_decay: List[float] = []
+        self.size: List[float] = []
+        self.pulse_timer: List[float] = []
+        self.pulse_speed: List[float] = []
+        self.particle_type: List[int] = []
+        self.color: List[Tuple[int, int, int]] = []
+        
+        # Color palette
+        self.colors = {
+            'pink': (255, 182, 193),      # Pink
+            'lilac': (200, 162, 200),     # Lilac
+            'cream': (255, 253, 208),     # Cream
+            'baby_blue': (173, 216, 230), # Blue
+            'peach': (255, 218, 185),     # Peach
+            'mint': (152, 251, 152),      # Green
+        }
+        
+        # Colors each effect picks from
+        self._heart_colors = list(self.colors.values())
+        self._trail_colors = [self.colors['cream'], self.colors['baby_blue']]
+        self._twinkle_colors = [self.colors['cream'], self.colors['baby_blue'], self.colors['mint']]
+        
+        # Pre-rendered particle sprites keyed by (type, size, color, alpha level)
+        self._sprite_cache = {}
+    
+    def __len__(self) -> int:
+        """Get the number of live particles."""
+        return len(self.x)
     
-    def __init__(self, x: int, y: int, particle_type: ParticleType, color: Tuple[int, int, int]):
+    def add_particle(self, x: float, y: float, particle_type: int, color: Tuple[int, int, int],
+                     velocity_x: Optional[float] = None, velocity_y: Optional[float] = None,
+                     life_decay: Optional[float] = None):
         """
-        Initialize a particle.
+        Add a single particle.
         
         Args:
             x: Starting X position
             y: Starting Y position
-            particle_type: Type of particle to create
+            particle_type: Particle type (HEART, SPARKLE, TWINKLE or COLLECT)
             color: RGB color tuple
+            velocity_x: X velocity, random if not given
+            velocity_y: Y velocity, random if not given
+            life_decay: Life lost per frame, random if not given
         """
-        self.x = float(x)
-        self.y = float(y)
-        self.particle_type = particle_type
-        self.color = color
+        uniform = self._rng.uniform
         
-        # Physics
-        self.velocity_x = random.uniform(-2, 2)
-        self.velocity_y = random.uniform(-3, -1)
-        self.gravity = 0.1
+        self.x.append(float(x))
+        self.y.append(float(y))
+        
+        # Physics (only hearts fall)
+        self.velocity_x.append(uniform(-2, 2) if velocity_x is None else velocity_x)
+        self.velocity_y.append(uniform(-3, -1) if velocity_y is None else velocity_y)
+        self.gravity.append(0.1 if particle_type == HEART else 0.0)
         
         # Lifecycle
-        self.life = 1.0
-        self.life_decay = random.uniform(0.01, 0.03)
+        self.life.append(1.0)
+        self.life_decay.append(uniform(0.01, 0.03) if life_decay is None else life_decay)
         
         # Visual properties
-        self.size = random.uniform(3, 8) if particle_type == ParticleType.HEART else random.uniform(2, 5)
-        self.rotation = 0
-        self.rotation_speed = random.uniform(-5, 5)
+        self.size.append(uniform(3, 8) if particle_type == HEART else uniform(2, 5))
+        self.pulse_timer.append(0.0)
+        self.pulse_speed.append(uniform(0.1, 0.3))
+        self.particle_type.append(particle_type)
+        self.color.append(color)
+    
+    def add_heart_burst(self, x: int, y: int, count: int = 5):
+        """
+        Add a burst of heart particles.
         
-        # Sparkle-specific
-        self.pulse_timer = 0
-        self.pulse_speed = random.uniform(0.1, 0.3)
+        Args:
+            x: Center X position
+            y: Center Y position
+            count: Number of hearts to create
+        """
+        for _ in range(count):
+            offset_x = self._rng.randint(-10, 10)
+            offset_y = self._rng.randint(-10, 10)
+            color = self._rng.choice(self._heart_colors)
+            
+            self.add_particle(x + offset_x, y + offset_y, HEART, color)
     
-    def update(self):
-        """Update particle physics and lifecycle."""
-        # Update position
-        self.x += self.velocity_x
-        self.y += self.velocity_y
+    def add_sparkle_trail(self, x: int, y: int, count: int = 3):
+        """
+        Add sparkle particles for movement trail.
         
-        # Apply gravity for hearts
-        if self.particle_type == ParticleType.HEART:
-            self.velocity_y += self.gravity
+        Args:
+            x: Center X position
+            y: Center Y position
+            count: Number of sparkles to create
+        """
+        for _ in range(count):
+            offset_x = self._rng.randint(-15, 15)
+            offset_y = self._rng.randint(-15, 15)
+            color = self._rng.choice(self._trail_colors)
+            
+            # Shorter life for trail
+            self.add_particle(x + offset_x, y + offset_y, SPARKLE, color, life_decay=0.05)
+    
+    def add_collect_effect(self, x: int, y: int):
+        """
+        Add collection effect particles.
         
-        # Update rotation
-        self.rotation += self.rotation_speed
+        Args:
+            x: Center X position
+            y: Center Y position
+        """
+        # Add collection stars
+        for _ in range(8):
+            angle = self._rng.uniform(0, 2 * math.pi)
+            distance = self._rng.uniform(10, 30)
+            direction_x = math.cos(angle)
+            direction_y = math.sin(angle)
+            particle_x = x + distance * direction_x
+            particle_y = y + distance * direction_y
+            
+            self.add_particle(int(particle_x), int(particle_y), COLLECT, self.colors['cream'],
+                              velocity_x=2 * direction_x, velocity_y=2 * direction_y)
         
-        # Update pulse for sparkles
-        self.pulse_timer += self.pulse_speed
+        # Add hearts
+        self.add_heart_burst(x, y, 3)
+    
+    def add_ambient_twinkles(self, screen_width: int, screen_height: int):
+        """
+        Add ambient twinkle effects across the screen.
         
-        # Decay life
-        self.life -= self.life_decay
+        Args:
+            screen_width: Screen width
+            screen_height: Screen height
+        """
+        if self._rng.random() < 0.1:  
+            x = self._rng.randint(0, screen_width)
+            y = self._rng.randint(0, screen_height)
+            color = self._rng.choice(self._twinkle_colors)
+            
+            self.add_particle(x, y, TWINKLE, color,
+                              velocity_x=0, velocity_y=0, life_decay=0.02)
+    
+    def update(self):
+        """Update all particles."""
+        if not self.x:
+            return
         
-        return self.life > 0
+        # Integrate every particle in place so no lists are reallocated per frame
+        x, y, life, pulse_timer = self.x, self.y, self.life, self.pulse_timer
+        velocity_x, velocity_y = self.velocity_x, self.velocity_y
+        gravity, pulse_speed, life_decay = self.gravity, self.pulse_speed, self.life_decay
+        any_dead = False
+        for i in range(len(x)):
+            # Update position, then apply gravity
+            x[i] += velocity_x[i]
+            y[i] += velocity_y[i]
+            velocity_y[i] += gravity[i]
+            
+            # Update pulse for sparkles
+            pulse_timer[i] += pulse_speed[i]
+            
+            # Decay life
+            life[i] -= life_decay[i]
+            if life[i] <= 0:
+                any_dead = True
+        
+        # Remove dead particles from every list in place, back to front
+        if any_dead:
+            dead = [i for i, remaining in enumerate(life) if remaining <= 0]
+            dead.reverse()
+            for field in self._FIELDS:
+                values = getattr(self, field)
+                for i in dead:
+                    del values[i]
     
     def draw(self, screen: pygame.Surface):
         """
-        Draw the particle on screen.
+        Draw all particles.
         
         Args:
             screen: Pygame surface to draw on
         """
-        if self.life <= 0:
+        if not self.x:
             return
         
-        # Calculate alpha based on life
-        alpha = max(0, min(255, int(self.life * 255)))
-        color_with_alpha = (*self.color, alpha)
+        sprites = self._sprite_cache
+        top_level = PARTICLE_ALPHA_LEVELS - 1
+        blit_sequence = []
         
-        # Create temporary surface for alpha blending
-        temp_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
+        for x, y, life, size, pulse_timer, particle_type, color in zip(
+                self.x, self.y, self.life, self.size, self.pulse_timer, self.particle_type, self.color):
+            # Sparkles pulse in size
+            if particle_type == SPARKLE:
+                size *= 1 + 0.3 * math.sin(pulse_timer)
+            
+            # Fade based on life
+            alpha_level = max(0, min(top_level, int(life * PARTICLE_ALPHA_LEVELS)))
+            
+            sprite = sprites.get((particle_type, int(size), color, alpha_level))
+            if sprite is None:
+                sprite = self.get_sprite(particle_type, int(size), color, alpha_level)
+            blit_sequence.append((sprite, (x - 10, y - 10)))
         
-        if self.particle_type == ParticleType.HEART:
-            self.draw_heart(temp_surface, 10, 10, self.size, color_with_alpha)
-        elif self.particle_type == ParticleType.SPARKLE:
-            self.draw_sparkle(temp_surface, 10, 10, self.size, color_with_alpha)
-        elif self.particle_type == ParticleType.TWINKLE:
-            self.draw_twinkle(temp_surface, 10, 10, self.size, color_with_alpha)
-        elif self.particle_type == ParticleType.COLLECT:
-            self.draw_collect_star(temp_surface, 10, 10, self.size, color_with_alpha)
+        # Blit every particle in one call
+        screen.blits(blit_sequence, False)
+    
+    def get_sprite(self, particle_type: int, size: int, color: Tuple[int, int, int],
+                   alpha_level: int = PARTICLE_ALPHA_LEVELS - 1) -> pygame.Surface:
+        """
+        Get the pre-rendered sprite for a particle, drawing it on first use.
         
-        # Blit to main screen
-        screen.blit(temp_surface, (self.x - 10, self.y - 10))
+        Args:
+            particle_type: Type of particle
+            size: Particle size in whole pixels
+            color: RGB color tuple
+            alpha_level: Fade step, from 0 (faintest) to PARTICLE_ALPHA_LEVELS - 1 (opaque)
+            
+        Returns:
+            20x20 SRCALPHA surface with the particle drawn at its center
+        """
+        key = (particle_type, size, color, alpha_level)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            if alpha_level < PARTICLE_ALPHA_LEVELS - 1:
+                # Faded copy of the opaque sprite
+                sprite = self.get_sprite(particle_type, size, color).copy()
+                sprite.set_alpha((alpha_level + 1) * 256 // PARTICLE_ALPHA_LEVELS - 1)
+            else:
+                sprite = pygame.Surface((20, 20), pygame.SRCALPHA)
+                
+                if particle_type == HEART:
+                    self.draw_heart(sprite, 10, 10, size, color)
+                elif particle_type == SPARKLE:
+                    self.draw_sparkle(sprite, 10, 10, size, color)
+                elif particle_type == TWINKLE:
+                    self.draw_twinkle(sprite, 10, 10, size, color)
+                elif particle_type == COLLECT:
+                    self.draw_collect_star(sprite, 10, 10, size, color)
+                
+                # Match the display format so blits skip per-pixel conversion
+                if pygame.display.get_surface() is not None:
+                    sprite = sprite.convert_alpha()
+            
+            self._sprite_cache[key] = sprite
+        return sprite
     
     def draw_heart(self, surface: pygame.Surface, x: int, y: int, size: float, color: Tuple[int, int, int, int]):
         """Draw a heart shape."""
@@ -128,9 +317,10 @@ class Particle:
         ]
         pygame.draw.polygon(surface, color[:3], points)
     
-    def draw_sparkle(self, surface: pygame.Surface, x: int, y: int, size: float, color: Tuple[int, int, int, int]):
+    def draw_sparkle(self, surface: pygame.Surface, x: int, y: int, size: float, color: Tuple[int, int, int, int],
+                     pulse_timer: float = 0.0):
         """Draw a sparkle with pulsing effect."""
-        pulse_size = size * (1 + 0.3 * math.sin(self.pulse_timer))
+        pulse_size = size * (1 + 0.3 * math.sin(pulse_timer))
         sparkle_size = max(2, int(pulse_size))
         
         # Draw cross pattern
@@ -168,118 +358,17 @@ class Particle:
             (x - star_size//3, y - star_size//3),
         ]
         pygame.draw.polygon(surface, color[:3], points)
-
-
-class ParticleSystem:
-    """Manages multiple particles and effects."""
-    
-    def __init__(self):
-        """Initialize the particle system."""
-        self.particles: List[Particle] = []
-        
-        # Color palette
-        self.colors = {
-            'pink': (255, 182, 193),      # Pink
-            'lilac': (200, 162, 200),     # Lilac
-            'cream': (255, 253, 208),     # Cream
-            'baby_blue': (173, 216, 230), # Blue
-            'peach': (255, 218, 185),     # Peach
-            'mint': (152, 251, 152),      # Green
-        }
-    
-    def add_heart_burst(self, x: int, y: int, count: int = 5):
-        """
-        Add a burst of heart particles.
-        
-        Args:
-            x: Center X position
-            y: Center Y position
-            count: Number of hearts to create
-        """
-        for _ in range(count):
-            offset_x = random.randint(-10, 10)
-            offset_y = random.randint(-10, 10)
-            color = random.choice(list(self.colors.values()))
-            
-            particle = Particle(x + offset_x, y + offset_y, ParticleType.HEART, color)
-            self.particles.append(particle)
     
-    def add_sparkle_trail(self, x: int, y: int, count: int = 3):
+    def get_dirty_rects(self) -> List[pygame.Rect]:
         """
-        Add sparkle particles for movement trail.
+        Get the screen regions covered by live particles.
         
-        Args:
-            x: Center X position
-            y: Center Y position
-            count: Number of sparkles to create
-        """
-        for _ in range(count):
-            offset_x = random.randint(-15, 15)
-            offset_y = random.randint(-15, 15)
-            color = random.choice([self.colors['cream'], self.colors['baby_blue']])
-            
-            particle = Particle(x + offset_x, y + offset_y, ParticleType.SPARKLE, color)
-            particle.life_decay = 0.05  # Shorter life for trail
-            self.particles.append(particle)
-    
-    def add_collect_effect(self, x: int, y: int):
-        """
-        Add collection effect particles.
-        
-        Args:
-            x: Center X position
-            y: Center Y position
-        """
-        # Add collection stars
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(10, 30)
-            particle_x = x + distance * math.cos(angle)
-            particle_y = y + distance * math.sin(angle)
-            
-            particle = Particle(int(particle_x), int(particle_y), ParticleType.COLLECT, self.colors['cream'])
-            particle.velocity_x = 2 * math.cos(angle)
-            particle.velocity_y = 2 * math.sin(angle)
-            self.particles.append(particle)
-        
-        # Add hearts
-        self.add_heart_burst(x, y, 3)
-    
-    def add_ambient_twinkles(self, screen_width: int, screen_height: int):
-        """
-        Add ambient twinkle effects across the screen.
-        
-        Args:
-            screen_width: Screen width
-            screen_height: Screen height
-        """
-        if random.random() < 0.1:  
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            color = random.choice([self.colors['cream'], self.colors['baby_blue'], self.colors['mint']])
-            
-            particle = Particle(x, y, ParticleType.TWINKLE, color)
-            particle.velocity_x = 0
-            particle.velocity_y = 0
-            particle.gravity = 0
-            particle.life_decay = 0.02
-            self.particles.append(particle)
-    
-    def update(self):
-        """Update all particles."""
-        # Update particles and remove dead ones
-        self.particles = [p for p in self.particles if p.update()]
-    
-    def draw(self, screen: pygame.Surface):
-        """
-        Draw all particles.
-        
-        Args:
-            screen: Pygame surface to draw on
+        Returns:
+            List of rects bounding each particle's draw surface
         """
-        for particle in self.particles:
-            particle.draw(screen)
+        return [pygame.Rect(int(x) - 11, int(y) - 11, 22, 22) for x, y in zip(self.x, self.y)]
     
     def clear(self):
         """Clear all particles."""
-        self.particles.clear() 
\ No newline at end of file
+        for field in self._FIELDS:
+            getattr(self, field).clear() 
@@ -5,15 +5,25 @@ Contains the Mouse class representing the player character.
 """
 
 import pygame
-from typing import TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from level import Level
 
 
+# Transparent border around the mouse sprite for art that spills past the cell
+SPRITE_MARGIN = 2
+
+
 class Mouse:
     """Player character - a mouse that moves on a grid."""
     
+    __slots__ = (
+        'grid_x', 'grid_y', 'grid_size', 'pixel_x', 'pixel_y', '_rect',
+        'body_color', 'belly_color', 'size',
+        'animation_timer', 'animation_speed', '_sprite_frames',
+    )
+    
     def __init__(self, grid_x: int, grid_y: int, grid_size: int):
         """
         Initialize the mouse.
@@ -27,6 +37,11 @@ class Mouse:
         self.grid_y = grid_y
         self.grid_size = grid_size
         
+        # Pixel position, kept in step with the grid position by _sync_pixels
+        self.pixel_x = grid_x * grid_size
+        self.pixel_y = grid_y * grid_size
+        self._rect = pygame.Rect(self.pixel_x, self.pixel_y, grid_size, grid_size)
+        
         # Visual properties
         self.body_color = (255, 182, 193)  # Pink
         self.belly_color = (255, 253, 208)  # Cream
@@ -36,15 +51,29 @@ class Mouse:
         self.animation_timer = 0
         self.animation_speed = 10
         
-    @property
-    def pixel_x(self) -> int:
-        """Get pixel X position from grid position."""
-        return self.grid_x * self.grid_size
+        # Pre-rendered mouse, one frame per tail sway direction. Extra width
+        # leaves room for the tail poking out to the right.
+        self._sprite_frames = [pygame.Surface((self.size + 2 * SPRITE_MARGIN + 16,
+                                               self.size + 2 * SPRITE_MARGIN), pygame.SRCALPHA)
+                               for _ in range(2)]
+        self._bake_sprite(0, 4)
+        self._bake_sprite(1, -4)
+        
+        # Match the display format so blits skip per-pixel conversion
+        if pygame.display.get_surface() is not None:
+            self._sprite_frames = [frame.convert_alpha() for frame in self._sprite_frames]
+        
+    def _sync_pixels(self):
+        """Recompute the pixel position after the grid position changed."""
+        self.pixel_x = self.grid_x * self.grid_size
+        self.pixel_y = self.grid_y * self.grid_size
+        self._rect.topleft = (self.pixel_x, self.pixel_y)
     
     @property
-    def pixel_y(self) -> int:
-        """Get pixel Y position from grid position."""
-        return self.grid_y * self.grid_size
+    def center(self) -> Tuple[int, int]:
+        """Get pixel position of the center of the current cell."""
+        half = self.grid_size // 2
+        return (self.pixel_x + half, self.pixel_y + half)
     
     def move(self, dx: int, dy: int, level: 'Level') -> bool:
         """
@@ -65,6 +94,7 @@ class Mouse:
         if self.can_move_to(new_x, new_y, level):
             self.grid_x = new_x
             self.grid_y = new_y
+            self._sync_pixels()
             return True
         
         return False
@@ -81,39 +111,58 @@ class Mouse:
         Returns:
             True if position is valid, False otherwise
         """
-        # Check bounds
-        if (grid_x < 0 or grid_x >= level.width or 
-            grid_y < 0 or grid_y >= level.height):
+        # The wall mask's blocked border covers the bounds check
+        if level.wall_mask[(grid_y + 1) * level.wall_stride + grid_x + 1]:
             return False
         
-        # Check for walls/obstacles
-        return not level.is_wall(grid_x, grid_y)
+        return not level.has_rolling_obstacle(grid_x, grid_y)
     
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
         Draw the mouse on the screen.
         
         Args:
             screen: Pygame surface to draw on
+            
+        Returns:
+            Screen area touched by the draw (empty if nothing was visible)
         """
         # Update animation
-        self.animation_timer += 1
-        if self.animation_timer >= self.animation_speed * 2:
-            self.animation_timer = 0
+        self.animation_timer = (self.animation_timer + 1) % (self.animation_speed * 2)
+        
+        # Pre-rendered mouse for the current tail frame (first or second half of the cycle)
+        sprite = self._sprite_frames[self.animation_timer // self.animation_speed]
+        x = self.pixel_x + 2 - SPRITE_MARGIN
+        y = self.pixel_y + 2 - SPRITE_MARGIN
         
-        # Calculate position with small offset for centering
-        x = self.pixel_x + 2
-        y = self.pixel_y + 2
-        center_x = x + self.size // 2
-        center_y = y + self.size // 2
+        # Skip mice that are fully outside the visible area
+        viewport = screen.get_clip()
+        width, height = sprite.get_size()
+        if (x + width <= viewport.left or x >= viewport.right or
+                y + height <= viewport.top or y >= viewport.bottom):
+            return pygame.Rect(x, y, 0, 0)
+        
+        return screen.blit(sprite, (x, y))
+    
+    def _bake_sprite(self, frame_idx: int, tail_sway: int):
+        """
+        Render the mouse for one tail frame into the sprite cache.
+        
+        Args:
+            frame_idx: Index into the sprite frame list
+            tail_sway: Vertical tail offset for this frame
+        """
+        surface = self._sprite_frames[frame_idx]
+        center_x = SPRITE_MARGIN + self.size // 2
+        center_y = SPRITE_MARGIN + self.size // 2
         
         # Mouse body (larger, rounder)
         body_radius = self.size // 2
-        pygame.draw.circle(screen, self.body_color, (center_x, center_y), body_radius)
+        pygame.draw.circle(surface, self.body_color, (center_x, center_y), body_radius)
         
         # Belly 
         belly_radius = body_radius - 4
-        pygame.draw.circle(screen, self.belly_color, (center_x, center_y + 2), belly_radius)
+        pygame.draw.circle(surface, self.belly_color, (center_x, center_y + 2), belly_radius)
         
         # Ears 
         ear_radius = self.size // 5
@@ -121,17 +170,17 @@ class Mouse:
         ear_offset_y = self.size // 4
         
         # Left ear (outer)
-        pygame.draw.circle(screen, self.body_color,
+        pygame.draw.circle(surface, self.body_color,
                          (center_x - ear_offset_x, center_y - ear_offset_y), ear_radius)
         # Left ear (inner)
-        pygame.draw.circle(screen, (255, 192, 203),  # Pink inner ear
+        pygame.draw.circle(surface, (255, 192, 203),  # Pink inner ear
                          (center_x - ear_offset_x, center_y - ear_offset_y), ear_radius - 2)
         
         # Right ear (outer)
-        pygame.draw.circle(screen, self.body_color,
+        pygame.draw.circle(surface, self.body_color,
                          (center_x + ear_offset_x, center_y - ear_offset_y), ear_radius)
         # Right ear (inner)
-        pygame.draw.circle(screen, (255, 192, 203),  # Pink inner ear
+        pygame.draw.circle(surface, (255, 192, 203),  # Pink inner ear
                          (center_x + ear_offset_x, center_y - ear_offset_y), ear_radius - 2)
         
         # Eyes
@@ -140,57 +189,58 @@ class Mouse:
         eye_y_offset = -3
         
         # Left eye 
-        pygame.draw.circle(screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                          (center_x - eye_offset, center_y + eye_y_offset), eye_radius)
         # Left eye pupil
-        pygame.draw.circle(screen, (0, 0, 0),
+        pygame.draw.circle(surface, (0, 0, 0),
                          (center_x - eye_offset + 1, center_y + eye_y_offset), 2)
         # Left eye sparkle 
-        pygame.draw.circle(screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                          (center_x - eye_offset + 2, center_y + eye_y_offset - 1), 1)
         
         # Right eye 
-        pygame.draw.circle(screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                          (center_x + eye_offset, center_y + eye_y_offset), eye_radius)
         # Right eye pupil
-        pygame.draw.circle(screen, (0, 0, 0),
+        pygame.draw.circle(surface, (0, 0, 0),
                          (center_x + eye_offset + 1, center_y + eye_y_offset), 2)
         # Right eye sparkle
-        pygame.draw.circle(screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                          (center_x + eye_offset + 2, center_y + eye_y_offset - 1), 1)
         
         # Draw nose 
         nose_y = center_y + 3
         nose_size = 2
-        pygame.draw.circle(screen, (255, 105, 180),  # Pink
+        pygame.draw.circle(surface, (255, 105, 180),  # Pink
                          (center_x - 1, nose_y - 1), nose_size // 2)
-        pygame.draw.circle(screen, (255, 105, 180),
+        pygame.draw.circle(surface, (255, 105, 180),
                          (center_x + 1, nose_y - 1), nose_size // 2)
-        pygame.draw.circle(screen, (255, 105, 180),
+        pygame.draw.circle(surface, (255, 105, 180),
                          (center_x, nose_y + 1), nose_size // 2)
         
         # Tail
-        tail_sway = 4 if self.animation_timer < self.animation_speed else -4
         tail_start = (center_x + body_radius - 2, center_y)
         tail_mid = (center_x + body_radius + 6, center_y + tail_sway)
         tail_end = (center_x + body_radius + 12, center_y - tail_sway)
         
         # Tail
-        pygame.draw.lines(screen, self.body_color, False, 
+        pygame.draw.lines(surface, self.body_color, False, 
                          [tail_start, tail_mid, tail_end], 3)
         
         # Add blush marks
         blush_color = (255, 192, 203, 128)  
-        pygame.draw.circle(screen, (255, 192, 203),
+        pygame.draw.circle(surface, (255, 192, 203),
                          (center_x - self.size // 3, center_y + 5), 3)
-        pygame.draw.circle(screen, (255, 192, 203),
+        pygame.draw.circle(surface, (255, 192, 203),
                          (center_x + self.size // 3, center_y + 5), 3)
     
     def get_rect(self) -> pygame.Rect:
         """
         Get the collision rectangle for the mouse.
         
+        The rect is shared and moves with the mouse; copy it before changing it.
+        
         Returns:
             pygame.Rect representing the mouse's bounds
         """
-        return pygame.Rect(self.pixel_x, self.pixel_y, self.grid_size, self.grid_size) 
\ No newline at end of file
+        return self._rect
\ No newline at end of file